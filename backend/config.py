@@ -12,12 +12,14 @@ UPLOAD_DIR = DATA_DIR / "uploads"
 PROCESSED_DIR = DATA_DIR / "processed"
 VIDEO_DIR = DATA_DIR / "videos"
 STATUS_DIR = DATA_DIR / "status"
+CACHE_DIR = DATA_DIR / "cache"
 
 # Create required directories
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
 VIDEO_DIR.mkdir(parents=True, exist_ok=True)
 STATUS_DIR.mkdir(parents=True, exist_ok=True)
+CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 # API Settings
 API_VERSION = "v1"
@@ -6,19 +6,40 @@ when AWS credentials are not available or when dependencies are missing
 
 import os
 import json
+import time
+import atexit
+import logging
 import tempfile
+import threading
 from typing import Dict, Any, Optional, Callable
-from functools import wraps
+from functools import cache, wraps
 from pathlib import Path
 
 # Import error utils
 from backend.utils.error_utils import log_error, try_import, error_handler
+from backend.utils.poll import poll_until
+
+logger = logging.getLogger(__name__)
 
 # Safe imports
 boto3 = try_import('boto3')
 cv2 = try_import('cv2')
 requests = try_import('requests')
 language_tool_python = try_import('language_tool_python')
+# Optional faster JSON parser for large transcripts; not a requirement, so
+# its absence is not logged as an error
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if boto3:
+    from botocore.config import Config
+    from botocore.exceptions import ClientError
+else:
+    # AWS calls are never made without boto3; this only keeps except clauses valid
+    class ClientError(Exception):
+        pass
 
 # Import AWS configuration from .env file via backend/config.py
 from backend.config import (
@@ -46,6 +67,88 @@ CAN_USE_REKOGNITION = CAN_USE_AWS and bool(cv2)
 CAN_USE_TRANSLATE = CAN_USE_AWS
 CAN_USE_POLLY = CAN_USE_AWS
 
+# Availability of each service by name, for requires_aws
+_SERVICE_FLAGS = {
+    "s3": CAN_USE_S3,
+    "transcribe": CAN_USE_TRANSCRIBE,
+    "comprehend": CAN_USE_COMPREHEND,
+    "rekognition": CAN_USE_REKOGNITION,
+    "translate": CAN_USE_TRANSLATE,
+    "polly": CAN_USE_POLLY
+}
+
+# Multipart settings for S3 uploads; extracted audio for long videos runs to
+# hundreds of MB, so upload it as concurrent 16 MB parts
+MB = 1024 * 1024
+if boto3:
+    from boto3.s3.transfer import TransferConfig
+    S3_TRANSFER_CONFIG = TransferConfig(
+        multipart_threshold=8 * MB,
+        multipart_chunksize=16 * MB,
+        max_concurrency=16,
+        use_threads=True
+    )
+else:
+    S3_TRANSFER_CONFIG = None
+
+# Files smaller than this are uploaded with a single PutObject request
+SMALL_UPLOAD_BYTES = 1 * MB
+
+# AWS clients are created from one session, once per service, and reused so
+# every call shares their connection pools and resolved credentials
+_CLIENT_CACHE = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+# Client settings: a connection pool large enough for the shared executor's
+# concurrent calls, adaptive retries (backoff with client-side rate limiting)
+# for throttling, and TCP keepalive so idle pooled connections stay usable
+AWS_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    tcp_keepalive=True
+) if boto3 else None
+
+# HTTP session for transcript downloads, reusing connections between fetches
+_HTTP_SESSION = requests.Session() if requests else None
+
+# Shared LanguageTool instance; the JVM behind it takes seconds to start,
+# so it is created once and kept alive for the lifetime of the process;
+# a failed start is recorded as _LANGUAGE_TOOL_FAILED and not retried
+_LANGUAGE_TOOL_FAILED = object()
+_LANGUAGE_TOOL = None
+_LANGUAGE_TOOL_LOCK = threading.Lock()
+
+def get_language_tool() -> Any:
+    """
+    Get the process-wide LanguageTool instance, starting it on first use
+
+    Set LANGUAGE_TOOL_SERVER (e.g. http://localhost:8081) to share a single
+    LanguageTool server between several worker processes.
+
+    Returns:
+        LanguageTool instance or None if language_tool_python is not available
+    """
+    global _LANGUAGE_TOOL
+
+    if not language_tool_python:
+        return None
+
+    if _LANGUAGE_TOOL is None:
+        with _LANGUAGE_TOOL_LOCK:
+            if _LANGUAGE_TOOL is None:
+                try:
+                    remote_server = os.getenv("LANGUAGE_TOOL_SERVER")
+                    if remote_server:
+                        _LANGUAGE_TOOL = language_tool_python.LanguageTool('en-US', remote_server=remote_server)
+                    else:
+                        _LANGUAGE_TOOL = language_tool_python.LanguageTool('en-US')
+                    atexit.register(_LANGUAGE_TOOL.close)
+                except Exception as e:
+                    log_error(e, "Failed to start LanguageTool")
+                    _LANGUAGE_TOOL = _LANGUAGE_TOOL_FAILED
+
+    return None if _LANGUAGE_TOOL is _LANGUAGE_TOOL_FAILED else _LANGUAGE_TOOL
+
 def requires_aws(service_name: str = None):
     """
     Decorator to check AWS availability before running a function
@@ -68,7 +171,7 @@ def requires_aws(service_name: str = None):
                     
             # Check specific service
             if service_name:
-                service_flag = globals().get(f"CAN_USE_{service_name.upper()}", False)
+                service_flag = _SERVICE_FLAGS.get(service_name.lower(), False)
                 if not service_flag:
                     fallback_fn = kwargs.pop('fallback_fn', None)
                     if fallback_fn:
@@ -81,6 +184,20 @@ def requires_aws(service_name: str = None):
         return wrapper
     return decorator
 
+@cache
+def _get_session() -> Any:
+    """
+    Get the boto3 session AWS clients are created from
+    
+    The session is created on first use rather than at import, so runs that
+    never call AWS (e.g. Whisper only) do not pay for setting it up.
+    """
+    return boto3.session.Session(
+        region_name=AWS_REGION,
+        aws_access_key_id=AWS_ACCESS_KEY,
+        aws_secret_access_key=AWS_SECRET_ACCESS_KEY
+    )
+
 @error_handler
 def get_aws_client(service_name: str) -> Any:
     """
@@ -96,28 +213,37 @@ def get_aws_client(service_name: str) -> Any:
         print(f"Cannot create AWS {service_name} client: {'boto3 not available' if not boto3 else 'credentials not found'}")
         return None
         
-    try:
-        # First try with explicit credentials
-        client = boto3.client(
-            service_name,
-            region_name=AWS_REGION,
-            aws_access_key_id=AWS_ACCESS_KEY,
-            aws_secret_access_key=AWS_SECRET_ACCESS_KEY
-        )
-        
-        # Test the client with a simple operation to verify credentials
-        if service_name == 's3':
-            try:
-                client.list_buckets()
-                print(f"Successfully connected to AWS {service_name}")
-            except Exception as e:
-                log_error(e, f"AWS {service_name} credentials test failed")
-                return None
-                
+    client = _CLIENT_CACHE.get(service_name)
+    if client is not None:
         return client
+        
+    try:
+        # Create the client from the shared session with explicit credentials;
+        # creating clients from one session is not thread-safe
+        with _CLIENT_CACHE_LOCK:
+            client = _CLIENT_CACHE.get(service_name)
+            if client is not None:
+                return client
+            client = _get_session().client(service_name, config=AWS_CLIENT_CONFIG)
     except Exception as e:
         log_error(e, f"Failed to create AWS {service_name} client")
         return None
+        
+    # Test the client with a simple operation to verify credentials; this is a
+    # network call (with retries), so it runs outside the lock to keep it from
+    # blocking clients for other services
+    if service_name == 's3':
+        try:
+            client.list_buckets()
+            print(f"Successfully connected to AWS {service_name}")
+        except Exception as e:
+            log_error(e, f"AWS {service_name} credentials test failed")
+            return None
+            
+    # Only working clients are cached, so a failed attempt is retried next time;
+    # if another thread cached one meanwhile, that one is used
+    with _CLIENT_CACHE_LOCK:
+        return _CLIENT_CACHE.setdefault(service_name, client)
 
 @error_handler
 def upload_to_s3(file_path: str, s3_key: str = None) -> Dict[str, Any]:
@@ -144,8 +270,48 @@ def upload_to_s3(file_path: str, s3_key: str = None) -> Dict[str, Any]:
         if s3_key is None:
             s3_key = os.path.basename(file_path)
             
-        # Upload to S3
-        s3.upload_file(file_path, AWS_S3_BUCKET, s3_key)
+        # Upload to S3; small files go up in a single PutObject request, which
+        # skips the transfer manager's threads and extra bookkeeping
+        if os.path.getsize(file_path) < SMALL_UPLOAD_BYTES:
+            with open(file_path, 'rb') as f:
+                s3.put_object(Bucket=AWS_S3_BUCKET, Key=s3_key, Body=f.read())
+        else:
+            s3.upload_file(file_path, AWS_S3_BUCKET, s3_key, Config=S3_TRANSFER_CONFIG)
+        media_uri = f"s3://{AWS_S3_BUCKET}/{s3_key}"
+        
+        return {
+            "success": True,
+            "media_uri": media_uri,
+            "bucket": AWS_S3_BUCKET,
+            "key": s3_key
+        }
+    except Exception as e:
+        return log_error(e, "S3 upload error")
+
+@error_handler
+def upload_fileobj_to_s3(fileobj: Any, s3_key: str) -> Dict[str, Any]:
+    """
+    Upload the contents of a readable binary stream to S3 with error handling
+    
+    The stream does not need to be seekable, so a subprocess pipe can be
+    uploaded as it is produced without writing it to disk first.
+    
+    Args:
+        fileobj: Binary file-like object to read from
+        s3_key: Key to use in S3
+        
+    Returns:
+        Dict with upload result info including media_uri if successful
+    """
+    if not CAN_USE_S3:
+        return {"error": True, "message": "S3 upload not available"}
+        
+    try:
+        s3 = get_aws_client('s3')
+        if not s3:
+            return {"error": True, "message": "Failed to create S3 client"}
+            
+        s3.upload_fileobj(fileobj, AWS_S3_BUCKET, s3_key, Config=S3_TRANSFER_CONFIG)
         media_uri = f"s3://{AWS_S3_BUCKET}/{s3_key}"
         
         return {
@@ -181,6 +347,16 @@ def delete_from_s3(s3_key: str) -> Dict[str, Any]:
     except Exception as e:
         return log_error(e, "S3 delete error")
 
+# Media formats start_transcription_job passes through; others are sent as mp3
+TRANSCRIBE_MEDIA_FORMATS = frozenset({'mp3', 'mp4', 'wav', 'flac', 'm4a'})
+
+# Keys of the Transcribe job Settings parameter that callers may override
+TRANSCRIBE_SETTINGS_KEYS = frozenset({
+    'ShowSpeakerLabels', 'MaxSpeakerLabels', 'ChannelIdentification',
+    'ShowAlternatives', 'MaxAlternatives', 'VocabularyFilterName',
+    'VocabularyFilterMethod', 'VocabularyName'
+})
+
 @error_handler
 def start_transcription_job(job_name: str, media_uri: str, settings: Dict[str, Any] = None, language_code: str = None) -> Dict[str, Any]:
     """
@@ -189,8 +365,10 @@ def start_transcription_job(job_name: str, media_uri: str, settings: Dict[str, A
     Args:
         job_name: Name for the transcription job
         media_uri: URI of the media file (s3:// path)
-        settings: Additional transcription settings
-        language_code: Language code for transcription (e.g., en-US, bn-IN)
+        settings: Additional transcription settings; keys Transcribe does not
+                  accept are dropped
+        language_code: Language code for transcription (e.g., en-US, bn-IN) or
+                       'auto' for automatic language identification
         
     Returns:
         Dict with job info
@@ -204,8 +382,8 @@ def start_transcription_job(job_name: str, media_uri: str, settings: Dict[str, A
             return {"error": True, "message": "Failed to create Transcribe client"}
             
         # Get file format from media_uri
-        media_format = os.path.splitext(media_uri)[1].lower().lstrip('.')
-        if media_format not in ['mp3', 'mp4', 'wav', 'flac', 'm4a']:
+        media_format = os.path.splitext(media_uri)[1][1:].lower()
+        if media_format not in TRANSCRIBE_MEDIA_FORMATS:
             media_format = 'mp3'  # Default format
             
         # Default settings for transcription    
@@ -214,45 +392,54 @@ def start_transcription_job(job_name: str, media_uri: str, settings: Dict[str, A
             'MaxSpeakerLabels': 10
         }
         
-        # Update with custom settings if provided
+        # Update with custom settings if provided, but filter out invalid parameters
         if settings:
-            job_settings.update(settings)
+            # Only include valid AWS Transcribe settings parameters
+            job_settings.update({k: v for k, v in settings.items() if k in TRANSCRIBE_SETTINGS_KEYS})
+            
+            # Target language is used for translation afterwards, not by Transcribe
+            if 'target_language' in settings:
+                print(f"Note: Target language '{settings['target_language']}' specified, but AWS Transcribe API doesn't support direct translation.")
+                print("Proceeding with transcription only in source language.")
+                
+            invalid_keys = [k for k in settings if k not in TRANSCRIBE_SETTINGS_KEYS and k != 'target_language']
+            if invalid_keys:
+                print(f"Warning: Removed invalid settings parameters: {', '.join(invalid_keys)}")
             
-        # Start transcription job
         # Use provided language_code or fall back to environment variable
         lang_code = language_code if language_code else AWS_TRANSCRIBE_LANGUAGE_CODE
+        if lang_code == 'bn':
+            # Fix incorrect Bengali code - should be bn-IN not bn
+            lang_code = 'bn-IN'
+            
+        # Log job details for debugging; formatting is skipped unless debug logging is enabled
+        print(f"Starting AWS Transcribe job: {job_name}")
+        logger.debug("Media URI: %s, format: %s, language code: %s (requested: %s)",
+                     media_uri, media_format, lang_code, language_code)
+        logger.debug("Settings: %s", job_settings)
         
-        # Enhanced debugging for language parameter
-        print(f"DEBUG: AWS Utils - language_code parameter received: '{language_code}' (type: {type(language_code).__name__})")
-        print(f"DEBUG: AWS Utils - AWS_TRANSCRIBE_LANGUAGE_CODE env var: '{AWS_TRANSCRIBE_LANGUAGE_CODE}'")
-        print(f"DEBUG: AWS Utils - Final lang_code being used: '{lang_code}'")
+        job_args = {
+            'TranscriptionJobName': job_name,
+            'Media': {'MediaFileUri': media_uri},
+            'MediaFormat': media_format,
+            'Settings': job_settings
+        }
         
-        # Handle automatic language detection
+        # Start transcription job with appropriate language settings
         if lang_code == 'auto':
-            print(f"DEBUG: AWS Utils - Using automatic language identification")
-            response = transcribe.start_transcription_job(
-                TranscriptionJobName=job_name,
-                Media={'MediaFileUri': media_uri},
-                MediaFormat=media_format,
-                IdentifyLanguage=True,
-                Settings=job_settings
-            )
+            print("Using AWS Transcribe automatic language detection")
+            response = transcribe.start_transcription_job(IdentifyLanguage=True, **job_args)
         else:
-            # Ensure language code is valid for AWS Transcribe
-            if lang_code == 'bn':
-                # Fix incorrect Bengali code - should be bn-IN not bn
-                print(f"DEBUG: AWS Utils - Correcting Bengali language code from 'bn' to 'bn-IN'")
-                lang_code = 'bn-IN'
-            
-            print(f"DEBUG: AWS Utils - Starting AWS Transcribe job with language code: '{lang_code}'")
-            
-            response = transcribe.start_transcription_job(
-                TranscriptionJobName=job_name,
-                Media={'MediaFileUri': media_uri},
-                MediaFormat=media_format,
-                LanguageCode=lang_code,
-                Settings=job_settings
-            )
+            try:
+                response = transcribe.start_transcription_job(LanguageCode=lang_code, **job_args)
+            except ClientError as e:
+                if 'Value \'auto\' at \'languageCode\'' not in str(e):
+                    raise
+                # Handle the specific error when 'auto' is rejected as a language code
+                print("Retrying with IdentifyLanguage=True instead of language_code='auto'")
+                response = transcribe.start_transcription_job(IdentifyLanguage=True, **job_args)
+        
+        print(f"Transcription job started successfully: {job_name}")
         
         return {
             "success": True,
@@ -290,14 +477,73 @@ def check_transcription_job_status(job_name: str) -> Dict[str, Any]:
             "status": job_status
         }
         
-        # Include transcript URI if job completed
+        # Include transcript URI if job completed, or the reason it failed
         if job_status == 'COMPLETED':
             result['transcript_uri'] = response['TranscriptionJob']['Transcript']['TranscriptFileUri']
+        elif job_status == 'FAILED':
+            result['failure_reason'] = response['TranscriptionJob'].get('FailureReason', 'Unknown reason')
             
         return result
     except Exception as e:
         return log_error(e, "AWS Transcribe status check error")
 
+def wait_for_transcription_job(job_name: str, max_wait_seconds: int = 900, check_interval: int = 30) -> Optional[str]:
+    """
+    Wait for an AWS Transcribe job to complete with progress indicator
+    
+    Status checks back off exponentially with jitter, starting at one second.
+    
+    Args:
+        job_name: Name of the transcription job
+        max_wait_seconds: Maximum time to wait in seconds
+        check_interval: Longest time between status checks in seconds
+        
+    Returns:
+        Transcript URI if job completed successfully, None otherwise
+    """
+    start_time = time.monotonic()
+    
+    print(f"Waiting for AWS Transcribe job {job_name} to complete...")
+    
+    def _check_status():
+        status_result = check_transcription_job_status(job_name)
+        
+        # Show progress
+        elapsed = int(time.monotonic() - start_time)
+        remaining = max(0, max_wait_seconds - elapsed)
+        percent = min(100, int(elapsed / max_wait_seconds * 100))
+        if status_result.get("success"):
+            print(f"Job status: {status_result.get('status')}. Elapsed: {elapsed}s, Remaining: {remaining}s ({percent}%)")
+        return status_result
+    
+    try:
+        status_result = poll_until(
+            _check_status,
+            lambda result: not result.get("success") or result.get("status") in ("COMPLETED", "FAILED"),
+            cap=check_interval,
+            timeout=max_wait_seconds
+        )
+    except Exception as e:
+        log_error(e, "Error waiting for transcription job")
+        return None
+    
+    elapsed = int(time.monotonic() - start_time)
+    if status_result is None:
+        # Timeout reached
+        print(f"\nTranscription job timed out after {max_wait_seconds} seconds")
+        return None
+    
+    status = status_result.get("status")
+    if status == "COMPLETED":
+        print(f"\nTranscription job completed after {elapsed} seconds")
+        return status_result.get("transcript_uri")
+    elif status == "FAILED":
+        print(f"\nTranscription job failed after {elapsed} seconds: {status_result.get('failure_reason')}")
+        return None
+    
+    print(f"\nError checking job status: {status_result.get('message')}")
+    return None
+
 @error_handler
 def fetch_transcript(transcript_uri: str) -> Dict[str, Any]:
     """
@@ -313,10 +559,20 @@ def fetch_transcript(transcript_uri: str) -> Dict[str, Any]:
         return {"error": True, "message": "Requests module not available"}
         
     try:
-        response = requests.get(transcript_uri)
+        # Read the decompressed body straight from the raw stream and parse those
+        # bytes, skipping the separate content and decoded-text copies that
+        # response.json() makes; the whole body is still read before parsing,
+        # since the ASS builders need the complete document
+        with _HTTP_SESSION.get(transcript_uri, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            if orjson:
+                transcript_data = orjson.loads(response.raw.read())
+            else:
+                transcript_data = json.load(response.raw)
         return {
             "success": True,
-            "data": response.json()
+            "data": transcript_data
         }
     except Exception as e:
         return log_error(e, "Transcript fetch error")
@@ -351,11 +607,10 @@ def correct_text_with_comprehend(text: str) -> Dict[str, Any]:
         
         # Fallback to language_tool_python for actual corrections
         corrected_text = text
-        if language_tool_python:
+        language_tool = get_language_tool()
+        if language_tool:
             try:
-                language_tool = language_tool_python.LanguageTool('en-US')
                 corrected_text = language_tool.correct(text)
-                language_tool.close()
             except Exception as inner_e:
                 corrected_text = text  # Use original text if correction fails
         
@@ -3,6 +3,7 @@ Error handling utilities for VideoSubtitleCleanser
 """
 
 import os
+import re
 import logging
 import traceback
 from functools import wraps
@@ -32,29 +33,34 @@ ERROR_TYPES = {
     "UNKNOWN_ERROR": "Unknown Error"
 }
 
+# Keywords that identify each error type, in the order the types take priority
+_ERROR_KEYWORDS = (
+    ("AWS_ERROR", ("aws", "s3")),
+    ("FILE_ERROR", ("file", "path", "directory")),
+    ("VIDEO_ERROR", ("video", "ffmpeg", "frame")),
+    ("AUDIO_ERROR", ("audio", "sound")),
+    ("SUBTITLE_ERROR", ("subtitle", "srt", "vtt")),
+    ("IMPORT_ERROR", ("import", "module")),
+    ("CONFIG_ERROR", ("config", "setting", "environment")),
+)
+_ERROR_TYPE_BY_KEYWORD = {keyword: error_type for error_type, keywords in _ERROR_KEYWORDS for keyword in keywords}
+_ERROR_TYPE_PRIORITY = {error_type: priority for priority, (error_type, _) in enumerate(_ERROR_KEYWORDS)}
+
+# Matches every keyword occurrence in one scan; the lookahead also finds keywords
+# that overlap, such as "sound" and "directory" in "soundirectory"
+_RE_ERROR_KEYWORD = re.compile("(?=(" + "|".join(_ERROR_TYPE_BY_KEYWORD) + "))")
+
 def classify_error(error_instance: Exception) -> str:
     """
     Classify the type of error based on the exception
     """
-    error_str = str(error_instance)
-    error_class = error_instance.__class__.__name__
-    
-    if "boto" in error_class.lower() or "aws" in error_str.lower() or "s3" in error_str.lower():
+    if "boto" in error_instance.__class__.__name__.lower():
         return "AWS_ERROR"
-    elif "file" in error_str.lower() or "path" in error_str.lower() or "directory" in error_str.lower():
-        return "FILE_ERROR"
-    elif "video" in error_str.lower() or "ffmpeg" in error_str.lower() or "frame" in error_str.lower():
-        return "VIDEO_ERROR"
-    elif "audio" in error_str.lower() or "sound" in error_str.lower():
-        return "AUDIO_ERROR" 
-    elif "subtitle" in error_str.lower() or "srt" in error_str.lower() or "vtt" in error_str.lower():
-        return "SUBTITLE_ERROR"
-    elif "import" in error_str.lower() or "module" in error_str.lower() or "no module" in error_str.lower():
-        return "IMPORT_ERROR"
-    elif "config" in error_str.lower() or "setting" in error_str.lower() or "environment" in error_str.lower():
-        return "CONFIG_ERROR"
-    else:
+    
+    error_types = {_ERROR_TYPE_BY_KEYWORD[keyword] for keyword in _RE_ERROR_KEYWORD.findall(str(error_instance).lower())}
+    if not error_types:
         return "UNKNOWN_ERROR"
+    return min(error_types, key=_ERROR_TYPE_PRIORITY.__getitem__)
 
 def log_error(error_instance: Exception, context: str = "", task_id: str = "") -> Dict[str, Any]:
     """
@@ -145,15 +151,26 @@ def get_error_suggestions(error_type: str, error_message: str) -> list:
         
     return suggestions
 
+# Results of try_import by module name, including modules that are missing
+_IMPORT_CACHE: Dict[str, Optional[Any]] = {}
+
 def try_import(module_name: str) -> Optional[Any]:
     """
     Try to import a module, return None if not available
+    
+    Results are cached, so a missing module is only looked for (and
+    reported) once.
     """
+    if module_name in _IMPORT_CACHE:
+        return _IMPORT_CACHE[module_name]
+        
     try:
-        return __import__(module_name)
+        module = __import__(module_name)
     except ImportError:
         logger.warning(f"Module {module_name} not available")
-        return None
+        module = None
+    _IMPORT_CACHE[module_name] = module
+    return module
 
 def error_handler(func):
     """
@@ -0,0 +1,52 @@
+"""
+Shared thread pool for background and I/O-bound work
+"""
+
+import os
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Any, Callable
+
+_EXECUTOR = None
+_EXECUTOR_LOCK = threading.Lock()
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Get the process-wide thread pool, creating it on first use
+
+    The pool is sized for I/O-bound work (subprocesses, AWS calls), so
+    callers should not block a pool thread waiting on other pool tasks.
+    
+    Pool threads are not daemon threads: the interpreter joins them at
+    exit, even though the registered shutdown does not wait, so a
+    running task delays exit until it returns. Open-ended waits (on
+    events, servers, user input) belong on a daemon thread instead.
+
+    Returns:
+        Shared ThreadPoolExecutor instance
+    """
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(
+                    max_workers=(os.cpu_count() or 1) * 2,
+                    thread_name_prefix="subtitle_cleanser"
+                )
+                atexit.register(_EXECUTOR.shutdown, wait=False)
+    return _EXECUTOR
+
+def submit(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+    """
+    Run a callable on the shared thread pool
+
+    Args:
+        fn: Callable to run
+        *args: Positional arguments for the callable
+        **kwargs: Keyword arguments for the callable
+
+    Returns:
+        Future for the callable's result
+    """
+    return get_executor().submit(fn, *args, **kwargs)
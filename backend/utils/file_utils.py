@@ -1,112 +1,134 @@
 import os
-import re
-import subprocess
-from pathlib import Path
+import shutil
+from functools import lru_cache
 from typing import List, Dict, Union, Optional, Any
 
-def ensure_directory_exists(directory_path: Union[str, Path]) -> None:
+SUBTITLE_EXTENSIONS = frozenset({'.srt', '.vtt', '.sub', '.sbv', '.smi', '.ssa', '.ass'})
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.mkv', '.avi', '.mov', '.wmv'})
+
+_MIME_TYPES = {
+    '.srt': 'application/x-subrip',
+    '.vtt': 'text/vtt',
+    '.sub': 'text/plain',
+    '.sbv': 'text/plain',
+    '.smi': 'text/plain',
+    '.ssa': 'text/plain',
+    '.ass': 'text/plain',
+    '.mp4': 'video/mp4',
+    '.mkv': 'video/x-matroska',
+    '.avi': 'video/x-msvideo',
+    '.mov': 'video/quicktime',
+    '.wmv': 'video/x-ms-wmv'
+}
+
+def ensure_directory_exists(directory_path: Union[str, os.PathLike]) -> None:
     """
     Ensure that a directory exists, creating it if necessary
     """
-    Path(directory_path).mkdir(parents=True, exist_ok=True)
+    os.makedirs(os.fspath(directory_path), exist_ok=True)
 
-def get_file_extension(file_path: Union[str, Path]) -> str:
+def get_file_extension(file_path: Union[str, os.PathLike]) -> str:
     """
     Get the file extension from a path
-    """
-    return os.path.splitext(file_path)[1].lower()
+    
+    Same result as os.path.splitext, found with two reverse scans instead.
+    """
+    path = os.fspath(file_path)
+    dot = path.rfind('.')
+    sep = path.rfind(os.sep)
+    if os.altsep:
+        sep = max(sep, path.rfind(os.altsep))
+    # Leading dots name hidden files rather than start an extension
+    if dot > sep + 1 and (path[sep + 1] != '.' or path[sep + 1:dot].strip('.')):
+        return path[dot:].lower()
+    return ''
 
-def is_valid_subtitle_file(file_path: Union[str, Path]) -> bool:
+def is_valid_subtitle_file(file_path: Union[str, os.PathLike]) -> bool:
     """
     Check if a file is a valid subtitle file based on extension
     """
-    valid_extensions = ['.srt', '.vtt', '.sub', '.sbv', '.smi', '.ssa', '.ass']
-    return get_file_extension(file_path) in valid_extensions
+    return get_file_extension(file_path) in SUBTITLE_EXTENSIONS
 
-def is_valid_video_file(file_path: Union[str, Path]) -> bool:
+def is_valid_video_file(file_path: Union[str, os.PathLike]) -> bool:
     """
     Check if a file is a valid video file based on extension
     """
-    valid_extensions = ['.mp4', '.mkv', '.avi', '.mov', '.wmv']
-    return get_file_extension(file_path) in valid_extensions
+    return get_file_extension(file_path) in VIDEO_EXTENSIONS
+
+# FFmpeg executables, resolved once; FFMPEG_BIN / FFPROBE_BIN override the PATH lookup
+FFMPEG_PATH = os.getenv("FFMPEG_BIN") or shutil.which("ffmpeg")
+FFPROBE_PATH = os.getenv("FFPROBE_BIN") or shutil.which("ffprobe")
 
 def has_ffmpeg() -> bool:
     """
     Check if FFmpeg is installed on the system
+    
+    Uses the path resolved at import instead of running the executable.
     """
-    try:
-        subprocess.run(["ffmpeg", "-version"], capture_output=True, check=False)
-        return True
-    except FileNotFoundError:
-        return False
+    return FFMPEG_PATH is not None
+
+# ",mmm" tails for every millisecond value
+_MILLISECOND_TAILS = tuple(",%03d" % i for i in range(1000))
 
 def format_timestamp(milliseconds: int) -> str:
     """
     Format milliseconds into SRT timestamp format (HH:MM:SS,mmm)
     """
-    seconds, milliseconds = divmod(milliseconds, 1000)
-    minutes, seconds = divmod(seconds, 60)
-    hours, minutes = divmod(minutes, 60)
+    total_seconds = milliseconds // 1000
+    total_minutes = total_seconds // 60
     
-    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+    return "%02d:%02d:%02d" % (
+        total_minutes // 60, total_minutes % 60, total_seconds % 60
+    ) + _MILLISECOND_TAILS[milliseconds % 1000]
 
 def parse_timestamp(timestamp: str) -> int:
     """
     Parse SRT timestamp format (HH:MM:SS,mmm) into milliseconds
-    """
-    if not timestamp:
-        return 0
-        
-    # Handle both comma and period as decimal separators
-    timestamp = timestamp.replace(',', '.')
     
-    parts = timestamp.split(':')
-    if len(parts) != 3:
-        return 0
-        
+    The fraction is read as a decimal fraction of a second, so "00:00:01.5"
+    is 1500 ms; digits beyond milliseconds are dropped.
+    """
     try:
-        hours = int(parts[0])
-        minutes = int(parts[1])
+        # Handle both comma and period as decimal separators
+        hours, minutes, seconds = timestamp.replace(',', '.').split(':')
         
-        second_parts = parts[2].split('.')
-        seconds = int(second_parts[0])
-        milliseconds = int(second_parts[1]) if len(second_parts) > 1 else 0
-        
-        total_milliseconds = (hours * 3600 + minutes * 60 + seconds) * 1000 + milliseconds
-        return total_milliseconds
-    except ValueError:
+        second_parts = seconds.split('.')
+        milliseconds = 0
+        if len(second_parts) > 1:
+            fraction = second_parts[1]
+            if not fraction.isdigit():
+                return 0
+            milliseconds = int(fraction[:3].ljust(3, '0'))
+            
+        return (int(hours) * 3600 + int(minutes) * 60 + int(second_parts[0])) * 1000 + milliseconds
+    except (AttributeError, ValueError):
+        # No timestamp, or one that is not HH:MM:SS[,mmm]
         return 0
 
+# Removes characters that are invalid in filenames and replaces spaces with underscores
+_SANITIZE_TABLE = str.maketrans({**dict.fromkeys('\\/*?:"<>|'), ' ': '_'})
+
+# The same mapping for ASCII names, applied with bytes.translate
+_INVALID_FILENAME_BYTES = b'\\/*?:"<>|'
+_SPACE_TO_UNDERSCORE = bytes.maketrans(b' ', b'_')
+
+@lru_cache(maxsize=1024)
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize a filename by removing invalid characters
-    """
-    # Remove characters that are invalid in filenames
-    sanitized = re.sub(r'[\\/*?:"<>|]', '', filename)
-    # Replace spaces with underscores
-    sanitized = sanitized.replace(' ', '_')
     
-    return sanitized
+    Results are cached, since pipeline stages sanitize the same names repeatedly.
+    """
+    # One pass over the string removes invalid characters and replaces spaces;
+    # ASCII names, the common case, take the much cheaper bytes path
+    try:
+        encoded = filename.encode('ascii')
+    except UnicodeEncodeError:
+        return filename.translate(_SANITIZE_TABLE)
+    return encoded.translate(_SPACE_TO_UNDERSCORE, _INVALID_FILENAME_BYTES).decode('ascii')
 
-def get_mime_type(file_path: Union[str, Path]) -> str:
+def get_mime_type(file_path: Union[str, os.PathLike]) -> str:
     """
     Get the MIME type of a file based on its extension
     """
-    extension = get_file_extension(file_path)
-    
-    mime_types = {
-        '.srt': 'application/x-subrip',
-        '.vtt': 'text/vtt',
-        '.sub': 'text/plain',
-        '.sbv': 'text/plain',
-        '.smi': 'text/plain',
-        '.ssa': 'text/plain',
-        '.ass': 'text/plain',
-        '.mp4': 'video/mp4',
-        '.mkv': 'video/x-matroska',
-        '.avi': 'video/x-msvideo',
-        '.mov': 'video/quicktime',
-        '.wmv': 'video/x-ms-wmv'
-    }
-    
-    return mime_types.get(extension, 'application/octet-stream')
+    return _MIME_TYPES.get(get_file_extension(file_path), 'application/octet-stream')
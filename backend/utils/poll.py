@@ -0,0 +1,65 @@
+"""
+Polling helpers with jittered exponential backoff
+"""
+
+import time
+import random
+from typing import Any, Callable, Iterator, Optional
+
+def backoff_delays(base: float = 1.0, cap: float = 30.0, jitter: float = 0.25) -> Iterator[float]:
+    """
+    Generate delays of base, 2*base, 4*base, ... capped at cap, each randomized by +/- jitter
+
+    Args:
+        base: First delay in seconds
+        cap: Longest delay in seconds, before jitter
+        jitter: Fraction by which each delay is randomly stretched or shrunk
+
+    Yields:
+        Delay in seconds
+    """
+    delay = base
+    while True:
+        yield delay * (1 + random.uniform(-jitter, jitter))
+        delay = min(cap, delay * 2)
+
+def poll_until(
+    func: Callable[[], Any],
+    is_done: Callable[[Any], bool],
+    base: float = 1.0,
+    cap: float = 30.0,
+    jitter: float = 0.25,
+    timeout: Optional[float] = None,
+    on_wait: Optional[Callable[[int, float], None]] = None
+) -> Optional[Any]:
+    """
+    Call func until is_done accepts its result, backing off exponentially between calls
+
+    Args:
+        func: Function to poll
+        is_done: Predicate on func's result that ends polling
+        base: First delay in seconds
+        cap: Longest delay in seconds, before jitter
+        jitter: Fraction by which each delay is randomly stretched or shrunk
+        timeout: Give up after this many seconds (None to poll forever)
+        on_wait: Called as on_wait(attempt, elapsed_seconds) before each wait
+
+    Returns:
+        The accepted result, or None if the timeout was reached
+    """
+    start_time = time.monotonic()
+    for attempt, delay in enumerate(backoff_delays(base, cap, jitter)):
+        result = func()
+        if is_done(result):
+            return result
+
+        elapsed = time.monotonic() - start_time
+        if timeout is not None:
+            remaining = timeout - elapsed
+            if remaining <= 0:
+                return None
+            delay = min(delay, remaining)
+
+        if on_wait:
+            on_wait(attempt, elapsed)
+        time.sleep(delay)
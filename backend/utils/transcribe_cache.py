@@ -0,0 +1,148 @@
+"""
+On-disk cache of AWS Transcribe results
+Transcripts are looked up by a cheap sampled key of the media and the
+transcription settings, and each entry records a digest of the whole media file
+that is checked on a hit, so processing the same video again skips the S3
+upload and the transcription job without ever serving another video's transcript
+"""
+
+import os
+import json
+import uuid
+import hashlib
+from functools import lru_cache
+from typing import Dict, Any, Optional
+
+from backend.config import CACHE_DIR
+
+# Optional faster JSON library; cached transcripts of long videos run to tens of MB
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+TRANSCRIBE_CACHE_DIR = CACHE_DIR / "transcribe"
+TRANSCRIBE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+# Total size the cache may grow to before least recently used entries are evicted
+MAX_CACHE_BYTES = int(os.getenv("TRANSCRIBE_CACHE_MAX_MB", "512")) * 1024 * 1024
+
+def file_digest(file_path: str) -> str:
+    """
+    Compute the BLAKE2b digest of a whole file, reading it in 1 MiB chunks
+
+    Digests are remembered per path, size and modification time, so the
+    transcript and text-position caches of one run read the file only once.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Hex digest of the file content
+    """
+    stat = os.stat(file_path)
+    return _file_digest(os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+
+@lru_cache(maxsize=32)
+def _file_digest(file_path: str, size: int, mtime_ns: int) -> str:
+    """Digest a file; size and mtime_ns only key the cache"""
+    hasher = hashlib.blake2b(digest_size=32)
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+def make_key(content_hash: str, language_code: str = None, settings: Dict[str, Any] = None) -> str:
+    """
+    Build a cache key from the media hash and the transcription parameters
+
+    Args:
+        content_hash: Key identifying the media file's content
+        language_code: Transcription language code
+        settings: Transcription job settings
+
+    Returns:
+        Cache key
+    """
+    params = json.dumps([content_hash, language_code, settings or {}], sort_keys=True)
+    return hashlib.sha256(params.encode('utf-8')).hexdigest()
+
+def get(key: str, media_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up a cached transcript
+
+    An entry is only returned if it was made from a file with the same
+    content as media_path, so a different video that shares the sampled key
+    is treated as a miss.
+
+    Args:
+        key: Cache key from make_key
+        media_path: Path to the media file being transcribed
+
+    Returns:
+        Transcript data, or None if it is not cached
+    """
+    cache_path = TRANSCRIBE_CACHE_DIR / f"{key}.json"
+    try:
+        if orjson:
+            with open(cache_path, 'rb') as f:
+                entry = orjson.loads(f.read())
+        else:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        if entry.get("content_digest") != file_digest(media_path):
+            return None
+        # Mark the entry as recently used
+        os.utime(cache_path)
+        return entry["transcript"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        return None
+
+def put(key: str, data: Dict[str, Any], content_digest: str) -> None:
+    """
+    Store a transcript in the cache, evicting old entries if it is full
+
+    Args:
+        key: Cache key from make_key
+        data: Transcript data
+        content_digest: file_digest of the media file the transcript was made from
+    """
+    entry = {"content_digest": content_digest, "transcript": data}
+    cache_path = TRANSCRIBE_CACHE_DIR / f"{key}.json"
+    temp_path = TRANSCRIBE_CACHE_DIR / f"{key}.{uuid.uuid4().hex}.tmp"
+    try:
+        if orjson:
+            with open(temp_path, 'wb') as f:
+                f.write(orjson.dumps(entry))
+        else:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+        os.replace(temp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Warning: Could not cache transcript: {e}")
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        return
+    _evict()
+
+def _evict() -> None:
+    """Remove least recently used entries until the cache fits MAX_CACHE_BYTES"""
+    entries = []
+    total_size = 0
+    for entry in os.scandir(TRANSCRIBE_CACHE_DIR):
+        if entry.name.endswith('.json'):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total_size += stat.st_size
+
+    entries.sort()
+    for _, size, path in entries:
+        if total_size <= MAX_CACHE_BYTES:
+            break
+        try:
+            os.remove(path)
+            total_size -= size
+        except OSError:
+            pass
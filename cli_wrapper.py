@@ -6,18 +6,9 @@ Command line wrapper for video_to_subtitle.py functionalities
 import os
 import sys
 import argparse
-from pathlib import Path
 
-# Import the video_to_subtitle functions
-from video_to_subtitle import (
-    generate_ass_from_video,
-    generate_ass_from_video_whisper,
-    translate_ass_subtitles,
-    check_whisper_availability
-)
-
-def main():
-    """Main CLI entry point"""
+def build_parser():
+    """Build the command line parser"""
     parser = argparse.ArgumentParser(
         description="Generate ASS subtitle files from video with customizable features",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
@@ -52,8 +43,19 @@ def main():
     parser.add_argument("--outline", type=int, default=2, help="Outline thickness (default: 2)")
     parser.add_argument("--shadow", type=int, default=3, help="Shadow depth (default: 3)")
     parser.add_argument("--timeout", type=int, default=60, help="Timeout in seconds for AWS operations")
+    return parser
+
+def main():
+    """Main CLI entry point"""
+    args = build_parser().parse_args()
     
-    args = parser.parse_args()
+    # Import the video_to_subtitle functions only once the arguments are valid, so
+    # --help and usage errors do not pay for loading AWS, NumPy and OpenCV
+    from video_to_subtitle import (
+        generate_ass_from_video,
+        generate_ass_from_video_whisper,
+        translate_ass_subtitles
+    )
     
     # Set timeout environment variable from command line argument
     if args.timeout:
@@ -74,9 +76,7 @@ def main():
     
     # Check if output path is provided, if not, generate one
     if not args.output:
-        input_path = Path(args.input)
-        output_path = input_path.with_suffix('.ass')
-        args.output = str(output_path)
+        args.output = f"{os.path.splitext(args.input)[0]}.ass"
     
     # Generate subtitle based on selected tool
     success = False
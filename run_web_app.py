@@ -5,15 +5,14 @@ Launcher script for VideoSubtitleCleanser web application
 
 import os
 import sys
-import webbrowser
 import threading
-import time
+import webbrowser
 from pathlib import Path
 
-def open_browser():
-    """Open web browser after a short delay"""
-    time.sleep(2)
-    webbrowser.open('http://localhost:5000')
+def open_browser(server_ready, timeout):
+    """Open web browser once the server is listening"""
+    if server_ready.wait(timeout=timeout):
+        webbrowser.open('http://localhost:5000')
 
 def main():
     """Main entry point for the web application launcher"""
@@ -35,12 +34,14 @@ def main():
     # Add project root to path
     sys.path.insert(0, str(project_root))
     
-    # Start browser in a new thread
-    threading.Thread(target=open_browser).start()
-    
     # Import and run the web server
     try:
-        from web_server import run_server
+        from web_server import run_server, SERVER_READY, SERVER_READY_TIMEOUT
+        
+        # Open the browser in the background
+        threading.Thread(
+            target=open_browser, args=(SERVER_READY, SERVER_READY_TIMEOUT), daemon=True
+        ).start()
         print("Starting web server...")
         run_server(host='0.0.0.0', port=5000, open_browser_automatically=False)
     except Exception as e:
@@ -0,0 +1,33 @@
+"""
+Tests for backend.utils.file_utils timestamp parsing
+"""
+
+import pytest
+
+from backend.utils.file_utils import parse_timestamp
+
+@pytest.mark.parametrize("timestamp, expected", [
+    ("00:00:00,000", 0),
+    ("01:02:03,004", 3723004),
+    ("01:02:03.004", 3723004),
+    ("1:2:3", 3723000),
+    ("00:00:01.5", 1500),
+    ("00:00:01,2345", 1234),
+    ("-1:00:00", -3600000),
+])
+def test_parse_timestamp_valid(timestamp, expected):
+    assert parse_timestamp(timestamp) == expected
+
+@pytest.mark.parametrize("timestamp", [
+    None,
+    "",
+    "1:2:3:4",
+    "00:00:01abc",
+    "00:00:01,500 --> 00:00:02,000",
+    "00:00:01,",
+    "00:00:01,5x",
+    "00:01",
+    "aa:bb:cc",
+])
+def test_parse_timestamp_rejects_malformed(timestamp):
+    assert parse_timestamp(timestamp) == 0
@@ -17,11 +17,20 @@ import tempfile
 import uuid
 import re
 import json
-import traceback
+import math
+import hashlib
+import logging
 import time
+import bisect
+import itertools
 import subprocess
+import threading
+import urllib.request
 from pathlib import Path
-from datetime import timedelta
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
 
 # Add the project root to the path to ensure imports work correctly
 sys.path.insert(0, str(Path(__file__).resolve().parent))
@@ -38,7 +47,11 @@ except ImportError:
 # Import backend config to ensure all paths and settings are initialized
 # This will load AWS credentials from .env file through the dotenv loader in config.py
 try:
-    from backend.config import AWS_REGION, AWS_ACCESS_KEY, AWS_SECRET_ACCESS_KEY, AWS_S3_BUCKET
+    from backend.config import AWS_REGION, AWS_ACCESS_KEY, AWS_SECRET_ACCESS_KEY, AWS_S3_BUCKET, CACHE_DIR
+    from backend.utils.executor import get_executor
+    from backend.utils import transcribe_cache
+    from backend.utils.poll import poll_until
+    from backend.utils.file_utils import FFMPEG_PATH, FFPROBE_PATH
     print(f"Loaded AWS configuration from .env file via backend/config.py")
 except ImportError:
     print("Error: Could not import AWS configuration from .env file via backend/config.py")
@@ -52,37 +65,27 @@ except ImportError:
     print(f"  - AWS Secret Key: {'Set' if AWS_SECRET_ACCESS_KEY else 'Not set'}")
     print(f"  - AWS S3 Bucket: {AWS_S3_BUCKET}")
 
+# FFmpeg executables resolved once at import; the bare names are kept as a fallback so
+# a missing install still surfaces as FileNotFoundError from subprocess
+FFMPEG = FFMPEG_PATH or "ffmpeg"
+FFPROBE = FFPROBE_PATH or "ffprobe"
+
 # Import AWS utilities from the existing codebase
 try:
-    # First try to import from our enhanced AWS Transcribe utilities
-    try:
-        from backend.utils.aws_transcribe import (
-            upload_to_s3, 
-            start_transcription_job, 
-            check_transcription_job_status,
-            fetch_transcript,
-            wait_for_transcription_job,
-            CAN_USE_AWS,
-            CAN_USE_TRANSCRIBE,
-            CAN_USE_S3,
-            CAN_USE_TRANSLATE,
-            AWS_S3_BUCKET
-        )
-        print("Using enhanced AWS Transcribe utilities")
-    except ImportError:
-        # Fall back to original AWS utilities
-        from backend.utils.aws_utils import (
-            upload_to_s3, 
-            start_transcription_job, 
-            check_transcription_job_status,
-            fetch_transcript,
-            CAN_USE_AWS,
-            CAN_USE_TRANSCRIBE,
-            CAN_USE_S3,
-            CAN_USE_TRANSLATE,
-            AWS_S3_BUCKET
-        )
-        print("Using original AWS utilities")
+    from backend.utils.aws_utils import (
+        upload_to_s3, 
+        start_transcription_job, 
+        check_transcription_job_status,
+        fetch_transcript,
+        upload_fileobj_to_s3,
+        delete_from_s3,
+        get_aws_client,
+        CAN_USE_AWS,
+        CAN_USE_TRANSCRIBE,
+        CAN_USE_S3,
+        CAN_USE_TRANSLATE,
+        AWS_S3_BUCKET
+    )
         
     # Import error utilities
     from backend.utils.error_utils import log_error, try_import
@@ -93,10 +96,20 @@ try:
 except ImportError:
     print("Warning: Could not import AWS utilities from backend.utils.aws_utils")
     print("AWS Transcribe functionality may be limited")
+    upload_fileobj_to_s3 = None
     # Fallback imports if backend utilities are not available
     import boto3
     from botocore.exceptions import ClientError, NoCredentialsError
     
+    def get_aws_client(service_name):
+        """Create an AWS client directly with boto3"""
+        return boto3.client(
+            service_name,
+            region_name=AWS_REGION,
+            aws_access_key_id=AWS_ACCESS_KEY,
+            aws_secret_access_key=AWS_SECRET_ACCESS_KEY
+        )
+    
     # AWS credentials are already imported from backend.config
     # Debug AWS configuration
     print(f"AWS Configuration in video_to_subtitle.py (fallback):")
@@ -183,64 +196,61 @@ except ImportError:
         return {"success": False, "error": "AWS Transcribe not available"}
 
 # Define global utility functions for AWS Transcribe
-def wait_for_transcription_job(job_name, max_attempts=30, delay_seconds=10):
+def wait_for_transcription_job(job_name, max_attempts=30, delay_seconds=30):
     """
     Wait for an AWS Transcribe job to complete with enhanced timeout handling and progress display
     
+    Status checks back off exponentially (1s, 2s, 4s, ...) with jitter, so short
+    jobs are noticed quickly and long jobs are polled less often.
+    
     Args:
         job_name: Name of the transcription job
-        max_attempts: Maximum number of status check attempts (default: 30)
-        delay_seconds: Delay between status checks in seconds (default: 10)
+        max_attempts: Unused; kept for backward compatibility (the timeout bounds the wait)
+        delay_seconds: Longest delay between status checks in seconds (default: 30)
         
     Returns:
         Transcript URI if job completed successfully, None otherwise
     """
-    import time
-    
     # Get timeout from environment variable or CLI argument
     timeout_seconds = int(os.environ.get("AWS_TIMEOUT", os.environ.get("TIMEOUT", "300")))  # Default 5 minutes
     
-    # Calculate max_attempts based on timeout and delay
-    max_attempts = max(1, int(timeout_seconds / delay_seconds))
-    
     print(f"Waiting for transcription job {job_name} to complete (timeout: {timeout_seconds}s)...")
-    start_time = time.time()
+    start_time = time.monotonic()
+    
+    def _is_finished(result):
+        # Only a successful status check with a terminal status ends the wait
+        return (isinstance(result, dict) and result.get("success", False)
+                and result.get("status") in ("COMPLETED", "FAILED", "ERROR"))
+    
+    def _show_wait_progress(attempt, elapsed):
+        # Show progress indicator
+        if attempt % 3 == 0:  # Update message every 3 attempts
+            remaining = max(0, timeout_seconds - elapsed)
+            print(f"\rJob status: IN_PROGRESS. {int(remaining)}s remaining...", end='', flush=True)
+        
+        # Display progress bar
+        show_progress(int(elapsed), timeout_seconds, message="AWS Transcribe")
     
     try:
-        for attempt in range(max_attempts):
-            # Check if we've exceeded the timeout
-            elapsed = time.time() - start_time
-            if elapsed > timeout_seconds:
-                print(f"\nTranscription job timed out after {int(elapsed)}s")
-                return None
-                
-            # Check job status
-            result = check_transcription_job_status(job_name)
-            
-            # Handle result based on format
-            if isinstance(result, dict):
-                # Backend utility format
-                if result.get("success", False):
-                    status = result.get("status")
-                    if status == "COMPLETED":
-                        print(f"\nTranscription job completed successfully after {int(elapsed)}s")
-                        return result.get("transcript_uri")
-                    elif status in ["FAILED", "ERROR"]:
-                        print(f"\nTranscription job failed with status: {status}")
-                        return None
-            
-            # Show progress indicator
-            if attempt % 3 == 0:  # Update message every 3 attempts
-                remaining = max(0, timeout_seconds - elapsed)
-                print(f"\rJob status: IN_PROGRESS. {int(remaining)}s remaining...", end='', flush=True)
-            
-            # Display progress bar
-            show_progress(attempt, max_attempts, message="AWS Transcribe")
-            
-            # Wait before next check
-            time.sleep(delay_seconds)
-        
-        print(f"\nTranscription job timed out after {max_attempts} attempts")
+        result = poll_until(
+            lambda: check_transcription_job_status(job_name),
+            _is_finished,
+            cap=delay_seconds,
+            timeout=timeout_seconds,
+            on_wait=_show_wait_progress
+        )
+        elapsed = time.monotonic() - start_time
+        
+        if result is None:
+            print(f"\nTranscription job timed out after {int(elapsed)}s")
+            return None
+        
+        status = result.get("status")
+        if status == "COMPLETED":
+            print(f"\nTranscription job completed successfully after {int(elapsed)}s")
+            return result.get("transcript_uri")
+        
+        print(f"\nTranscription job failed with status: {status}")
         return None
         
     except KeyboardInterrupt:
@@ -250,6 +260,7 @@ def wait_for_transcription_job(job_name, max_attempts=30, delay_seconds=10):
 
 # Global constants
 AWS_TIMEOUT = 900  # 15 minutes timeout for AWS operations
+PROGRESS_INTERVAL = 0.5  # Minimum seconds between progress bar redraws in busy loops
 
 # Import required modules
 try:
@@ -307,36 +318,123 @@ def format_time_ass(seconds):
         # If it's already a string, assume it's already formatted
         return seconds
         
-    td = timedelta(seconds=seconds)
-    hours, remainder = divmod(td.seconds, 3600)
+    # Whole microseconds, rounded the same way timedelta(seconds=...) does
+    fraction, whole = math.modf(seconds)
+    total_microseconds = int(whole) * 1000000 + round(fraction * 1000000)
+    
+    # Time of day, as timedelta.seconds would give it
+    total_seconds, microseconds = divmod(total_microseconds, 1000000)
+    hours, remainder = divmod(total_seconds % 86400, 3600)
     minutes, seconds = divmod(remainder, 60)
     # ASS format uses centiseconds (1/100 of a second) instead of milliseconds
-    centiseconds = int(td.microseconds / 10000)
+    centiseconds = microseconds // 10000
     return f"{hours}:{minutes:02d}:{seconds:02d}.{centiseconds:02d}"
 
+# Single-pass grammar pattern used by apply_basic_grammar_corrections:
+# punctuation with its surrounding whitespace, "i m", other contractions,
+# or a whitespace run
+_RE_GRAMMAR = re.compile(
+    r'\s*([.,!?:;])\s*|\b(i\s+m)\b|\b(dont|cant|wont|lets)\b|\s+',
+    re.IGNORECASE
+)
+_CONTRACTIONS = {
+    'dont': "don't",
+    'cant': "can't",
+    'wont': "won't",
+    'lets': "let's",
+}
+
+# Punctuation that _RE_GRAMMAR always rewrites spacing around
+_GRAMMAR_PUNCTUATION = frozenset('.,!?:;')
+
+# Substrings that must be present for _RE_GRAMMAR to find a contraction in
+# whitespace-normalized lowercase ASCII text
+_CONTRACTION_HINTS = ('i m', 'dont', 'cant', 'wont', 'lets')
+
+def _grammar_replacement(match):
+    """Replacement for a single _RE_GRAMMAR match"""
+    punctuation, i_am, contraction = match.groups()
+    if punctuation:
+        # No space before punctuation, exactly one space after it
+        return punctuation + ' '
+    if i_am:
+        return "I'm"
+    if contraction:
+        return _CONTRACTIONS[contraction.casefold()]
+    # Collapse whitespace
+    return ' '
+
+# Dialogue line that starts with a speaker name, e.g. "John: ..."
+_RE_SPEAKER_NAME = re.compile(r'^[A-Z][a-z]+:')
+
 def apply_basic_grammar_corrections(text):
     """Apply basic grammar and punctuation corrections"""
-    # Fix common spacing issues
-    text = re.sub(r'\s+', ' ', text)  # Collapse multiple spaces
-    text = re.sub(r'\s*([.,!?:;])', r'\1', text)  # Remove space before punctuation
-    text = re.sub(r'([.,!?:;])\s*', r'\1 ', text)  # Add space after punctuation
+    # Capitalize first letter; spacing fixes never change a leading letter
+    if 'a' <= text[:1] <= 'z':
+        text = text[0].upper() + text[1:]
     
-    # Fix common capitalization issues
-    text = re.sub(r'^([a-z])', lambda m: m.group(1).upper(), text)  # Capitalize first letter
+    # Most lines need nothing else; check that cheaply before running the
+    # regex. Non-ASCII text always goes through the regex, since case-insensitive
+    # matching has extra equivalences there.
+    if (_GRAMMAR_PUNCTUATION.isdisjoint(text)
+            and text.isascii()
+            and ' '.join(text.split()) == text):
+        lowered = text.lower()
+        if not any(hint in lowered for hint in _CONTRACTION_HINTS):
+            return text
     
-    # Fix common contractions
-    text = re.sub(r'\bi m\b', "I'm", text, flags=re.IGNORECASE)
-    text = re.sub(r'\bdont\b', "don't", text, flags=re.IGNORECASE)
-    text = re.sub(r'\bcant\b', "can't", text, flags=re.IGNORECASE)
-    text = re.sub(r'\bwont\b', "won't", text, flags=re.IGNORECASE)
-    text = re.sub(r'\blets\b', "let's", text, flags=re.IGNORECASE)
+    # Fix spacing around punctuation, collapse whitespace and fix common
+    # contractions in one scan
+    return _RE_GRAMMAR.sub(_grammar_replacement, text)
+
+# Audio codecs AWS Transcribe reads directly, with the file extension to store them under
+_TRANSCRIBE_COPY_CODECS = {
+    'mp3': 'mp3',
+    'aac': 'm4a',
+    'flac': 'flac',
+    'pcm_s16le': 'wav',
+}
+
+# Of those, the ones ffmpeg can write to a pipe, with the ffmpeg output format to use
+_STREAM_COPY_FORMATS = {
+    'mp3': 'mp3',
+    'flac': 'flac',
+}
+
+def _probe_audio_codec(video_path):
+    """
+    Get the codec of the first audio stream in a video using ffprobe
     
-    return text
+    Returns:
+        Codec name (e.g. 'aac', 'mp3'), or None if it could not be determined
+    """
+    cmd = [
+        FFPROBE, "-v", "error",
+        "-select_streams", "a:0",
+        "-show_entries", "stream=codec_name",
+        "-of", "json", video_path
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+        
+    try:
+        streams = json.loads(result.stdout).get('streams') or []
+    except ValueError:
+        return None
+    return streams[0].get('codec_name') if streams else None
 
 def extract_audio_from_video(video_path, audio_path=None):
     """
     Extract audio from video file using ffmpeg with improved error handling
+    
+    When the audio track is already in a format AWS Transcribe accepts, it is
+    copied out as-is instead of being decoded and re-encoded to MP3.
     """
+    requested_path = audio_path
     if not audio_path:
         # Create a temporary audio file
         audio_path = os.path.join(tempfile.gettempdir(), f"{uuid.uuid4()}.mp3")
@@ -347,11 +445,29 @@ def extract_audio_from_video(video_path, audio_path=None):
             print(f"Error: Video file not found: {video_path}")
             return None
             
+        # Copy the audio stream when Transcribe can read its codec, unless the
+        # caller asked for a file of a different type
+        copy_extension = _TRANSCRIBE_COPY_CODECS.get(_probe_audio_codec(video_path))
+        if copy_extension and (not requested_path or requested_path.lower().endswith(f".{copy_extension}")):
+            copy_path = requested_path or f"{os.path.splitext(audio_path)[0]}.{copy_extension}"
+            copy_cmd = [
+                FFMPEG, "-hide_banner", "-loglevel", "warning",
+                "-y", "-i", video_path,
+                "-vn",  # No video
+                "-acodec", "copy",  # Keep the audio stream as it is
+                copy_path
+            ]
+            copy_result = subprocess.run(copy_cmd, check=False, capture_output=True, text=True, timeout=300)
+            if copy_result.returncode == 0:
+                print(f"Audio stream copied without re-encoding to: {copy_path}")
+                return copy_path
+            print(f"Copying the audio stream failed, re-encoding instead: {copy_result.stderr}")
+            
         # Use ffmpeg to extract audio with more robust settings
         # Use -hide_banner and -loglevel warning to reduce output noise
         # Use -stats to show progress
         cmd = [
-            "ffmpeg", "-hide_banner", "-loglevel", "warning", "-stats",
+            FFMPEG, "-hide_banner", "-loglevel", "warning", "-stats",
             "-y", "-i", video_path, 
             "-vn",  # No video
             "-acodec", "libmp3lame",  # Use libmp3lame codec for better compatibility
@@ -380,7 +496,7 @@ def extract_audio_from_video(video_path, audio_path=None):
             # Try alternative approach with different codec
             print("Trying alternative FFmpeg settings...")
             alt_cmd = [
-                "ffmpeg", "-hide_banner", "-loglevel", "warning",
+                FFMPEG, "-hide_banner", "-loglevel", "warning",
                 "-y", "-i", video_path, 
                 "-vn",
                 "-acodec", "pcm_s16le",  # Use PCM codec instead
@@ -412,10 +528,81 @@ def extract_audio_from_video(video_path, audio_path=None):
         print("Error: FFmpeg process timed out after 5 minutes")
         return None
     except Exception as e:
-        print(f"Error extracting audio: {str(e)}")
-        traceback.print_exc()
+        logger.exception("Error extracting audio: %s", e)
         return None
 
+def stream_audio_to_s3(video_path):
+    """
+    Extract audio from a video with ffmpeg and upload it to S3 as it is encoded
+    
+    ffmpeg writes MP3 (or the original MP3/FLAC stream, copied) to its stdout,
+    which is uploaded directly, so the audio is never written to a temporary file.
+    
+    Returns:
+        S3 media URI, or None if streaming is unavailable or failed
+    """
+    if upload_fileobj_to_s3 is None or not os.path.exists(video_path):
+        return None
+        
+    # Pass the audio stream through untouched when it is already MP3 or FLAC
+    copy_format = _STREAM_COPY_FORMATS.get(_probe_audio_codec(video_path))
+    if copy_format:
+        s3_key = f"{uuid.uuid4()}.{copy_format}"
+        cmd = [
+            FFMPEG, "-hide_banner", "-loglevel", "error",
+            "-i", video_path,
+            "-vn",  # No video
+            "-acodec", "copy",
+            "-f", copy_format, "pipe:1"
+        ]
+    else:
+        s3_key = f"{uuid.uuid4()}.mp3"
+        cmd = [
+            FFMPEG, "-hide_banner", "-loglevel", "error",
+            "-i", video_path,
+            "-vn",  # No video
+            "-acodec", "libmp3lame",
+            "-ar", "16000",  # Audio sample rate
+            "-ac", "1",  # Mono audio
+            "-b:a", "128k",  # Audio bitrate
+            "-f", "mp3", "pipe:1"
+        ]
+    
+    try:
+        process = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except OSError as e:
+        print(f"Could not start ffmpeg for streaming audio extraction: {e}")
+        return None
+        
+    try:
+        print("Streaming extracted audio to S3...")
+        upload_result = upload_fileobj_to_s3(process.stdout, s3_key)
+        if upload_result.get("success", False):
+            # The upload read stdout to the end, so ffmpeg is already exiting
+            returncode = process.wait(timeout=30)
+        else:
+            # The upload stopped reading, so ffmpeg may be blocked on a full pipe
+            process.kill()
+            returncode = process.wait()
+    except Exception as e:
+        process.kill()
+        process.wait()
+        print(f"Streaming audio upload failed: {e}")
+        delete_from_s3(s3_key)
+        return None
+    finally:
+        process.stdout.close()
+        
+    if returncode != 0 or not upload_result.get("success", False):
+        print("Streaming audio upload failed, falling back to extracting audio to a file")
+        if upload_result.get("success", False):
+            # Remove the partial upload
+            delete_from_s3(s3_key)
+        return None
+        
+    print(f"Audio streamed to: {upload_result.get('media_uri')}")
+    return upload_result.get("media_uri")
+
 # Only define these functions if we couldn't import them from backend.utils.aws_utils
 if 'upload_to_s3' not in globals():
     def upload_to_s3(file_path, bucket_name=None, object_name=None):
@@ -429,7 +616,7 @@ if 'upload_to_s3' not in globals():
             object_name = os.path.basename(file_path)
         
         # Create S3 client
-        s3_client = boto3.client('s3')
+        s3_client = get_aws_client('s3')
         
         try:
             s3_client.upload_file(file_path, bucket_name, object_name)
@@ -445,8 +632,8 @@ if 'start_transcription_job' not in globals():
         """
         Start an AWS Transcribe job with speaker diarization
         """
-        # Create Transcribe client
-        transcribe = boto3.client('transcribe')
+        # Get Transcribe client
+        transcribe = get_aws_client('transcribe')
         
         try:
             # Handle target language if it's in settings
@@ -513,8 +700,8 @@ if 'check_transcription_job_status' not in globals():
         """
         Check status of an AWS Transcribe job
         """
-        # Create Transcribe client
-        transcribe = boto3.client('transcribe')
+        # Get Transcribe client
+        transcribe = get_aws_client('transcribe')
         
         try:
             # Get job status
@@ -545,46 +732,44 @@ if 'check_transcription_job_status' not in globals():
     def wait_for_transcription_job(job_name, max_wait_seconds=900):
         """
         Wait for an AWS Transcribe job to complete with progress indicator
+        
+        Status checks back off exponentially with jitter, up to 10 seconds apart.
         """
-        start_time = time.time()
-        attempt = 0
-        max_attempts = max_wait_seconds // 10  # Check every 10 seconds
+        start_time = time.monotonic()
         
         print(f"Waiting for AWS Transcribe job {job_name} to complete...")
         
-        while time.time() - start_time < max_wait_seconds:
-            try:
-                attempt += 1
-                
-                # Show progress
-                elapsed = int(time.time() - start_time)
-                remaining = max(0, max_wait_seconds - elapsed)
-                show_progress("AWS Transcribe", elapsed, max_wait_seconds, width=40)
-                
-                # Check job status
-                status_result = check_transcription_job_status(job_name)
-                
-                if not status_result.get("success"):
-                    print(f"\nError checking job status: {status_result.get('error')}")
-                    return None
-                
-                status = status_result.get("status")
-                
-                if status == "COMPLETED":
-                    print(f"\nTranscription job completed after {elapsed} seconds")
-                    return status_result.get("transcript_uri")
-                elif status == "FAILED":
-                    print(f"\nTranscription job failed after {elapsed} seconds")
-                    return None
-                
-                # Wait before checking again
-                time.sleep(10)
-            except Exception as e:
-                print(f"\nError waiting for transcription job: {e}")
-                return None
-                
-        # Timeout reached
-        print(f"\nTranscription job timed out after {max_wait_seconds} seconds")
+        def _show_wait_progress(attempt, elapsed):
+            show_progress(int(elapsed), max_wait_seconds, width=40, message="AWS Transcribe")
+        
+        try:
+            status_result = poll_until(
+                lambda: check_transcription_job_status(job_name),
+                lambda result: not result.get("success") or result.get("status") in ("COMPLETED", "FAILED"),
+                cap=10,
+                timeout=max_wait_seconds,
+                on_wait=_show_wait_progress
+            )
+        except Exception as e:
+            print(f"\nError waiting for transcription job: {e}")
+            return None
+            
+        elapsed = int(time.monotonic() - start_time)
+        if status_result is None:
+            # Timeout reached
+            print(f"\nTranscription job timed out after {max_wait_seconds} seconds")
+            return None
+            
+        if not status_result.get("success"):
+            print(f"\nError checking job status: {status_result.get('error')}")
+            return None
+        
+        status = status_result.get("status")
+        if status == "COMPLETED":
+            print(f"\nTranscription job completed after {elapsed} seconds")
+            return status_result.get("transcript_uri")
+        
+        print(f"\nTranscription job failed after {elapsed} seconds")
         return None
 
 # Translation utility function
@@ -614,8 +799,11 @@ def translate_text(text, source_language_code, target_language_code):
         return text
         
     try:
-        # Create AWS Translate client
-        translate = boto3.client('translate', region_name=AWS_REGION)
+        # Get AWS Translate client
+        translate = get_aws_client('translate')
+        if not translate:
+            print("Failed to create AWS Translate client. Cannot perform translation.")
+            return text
         
         # Perform translation
         response = translate.translate_text(
@@ -659,30 +847,28 @@ def translate_ass_subtitles(ass_file_path, source_language_code, target_language
         # Track if we're in the Events section
         in_events = False
         translated_lines = []
-        translation_count = 0
-        total_lines = len(lines)
+        # Dialogue lines awaiting translation: (index in translated_lines, parts, marker, spoken text)
+        pending_dialogue = []
         
         print(f"\nTranslating subtitles from {source_language_code} to {target_language_code}...")
         
-        for i, line in enumerate(lines):
-            # Show progress every 10 lines
-            if i % 10 == 0:
-                show_progress(i, total_lines, message="Translation progress")
-                
+        for line in lines:
+            stripped_line = line.strip()
+            
             # Check if we're entering the Events section
-            if line.strip() == '[Events]':
+            if stripped_line == '[Events]':
                 in_events = True
                 translated_lines.append(line)
                 continue
                 
             # Check if we're in a new section
-            if line.strip() and line.strip()[0] == '[' and line.strip()[-1] == ']':
-                in_events = (line.strip() == '[Events]')
+            if stripped_line.startswith('[') and stripped_line.endswith(']'):
+                in_events = False
                 translated_lines.append(line)
                 continue
                 
             # If we're in the Events section and the line starts with "Dialogue:"
-            if in_events and line.strip().startswith('Dialogue:'):
+            if in_events and stripped_line.startswith('Dialogue:'):
                 # Split the line by commas to separate the text
                 parts = line.split(',', 9)  # Split into 10 parts, with the last part being the dialogue text
                 
@@ -703,21 +889,9 @@ def translate_ass_subtitles(ass_file_path, source_language_code, target_language
                         spoken_text = dialogue_text[len(diar_marker):].lstrip()
                     # Add more patterns here if needed
 
-                    # Translate only the spoken text
-                    translated_spoken = translate_text(spoken_text, source_language_code, target_language_code)
-
-                    # Re-attach diarization marker to translated text
-                    translated_dialogue = f"{diar_marker} {translated_spoken}" if diar_marker else translated_spoken
-
-                    # Replace the dialogue text with the translated text
-                    parts[9] = translated_dialogue.strip()
-                    
-                    # Rejoin the parts and ensure newline
-                    translated_line = ','.join(parts)
-                    if not translated_line.endswith('\n'):
-                        translated_line += '\n'
-                    translated_lines.append(translated_line)
-                    translation_count += 1
+                    # Translate only the spoken text, once all dialogue has been collected
+                    pending_dialogue.append((len(translated_lines), parts, diar_marker, spoken_text))
+                    translated_lines.append(None)
                 else:
                     # If the line doesn't have enough parts, keep it as is
                     translated_lines.append(line)
@@ -727,9 +901,40 @@ def translate_ass_subtitles(ass_file_path, source_language_code, target_language
                     line += '\n'
                 translated_lines.append(line)
         
+        # Translate each distinct text once (subtitles repeat names, titles and
+        # short replies), with requests running concurrently
+        unique_texts = list(dict.fromkeys(spoken_text for _, _, _, spoken_text in pending_dialogue))
+        translations = {}
+        translated_texts = get_executor().map(
+            lambda text: translate_text(text, source_language_code, target_language_code), unique_texts
+        )
+        last_progress_time = 0.0
+        for i, (text, translated_text) in enumerate(zip(unique_texts, translated_texts)):
+            translations[text] = translated_text
+            # Show progress at most every PROGRESS_INTERVAL seconds
+            now = time.monotonic()
+            if now - last_progress_time >= PROGRESS_INTERVAL:
+                show_progress(i, len(unique_texts), message="Translation progress")
+                last_progress_time = now
+        
+        for index, parts, diar_marker, spoken_text in pending_dialogue:
+            translated_spoken = translations[spoken_text]
+            
+            # Re-attach diarization marker to translated text
+            translated_dialogue = f"{diar_marker} {translated_spoken}" if diar_marker else translated_spoken
+
+            # Replace the dialogue text with the translated text
+            parts[9] = translated_dialogue.strip()
+            
+            # Rejoin the parts and ensure newline
+            translated_line = ','.join(parts)
+            if not translated_line.endswith('\n'):
+                translated_line += '\n'
+            translated_lines[index] = translated_line
+        
         # Show 100% progress
-        show_progress(total_lines, total_lines, message="Translation progress")
-        print(f"\nTranslated {translation_count} dialogue lines.")
+        show_progress(len(unique_texts), len(unique_texts), message="Translation progress")
+        print(f"\nTranslated {len(pending_dialogue)} dialogue lines.")
         
         # Write the translated lines to a new file
         with open(translated_file_path, 'w', encoding='utf-8') as f:
@@ -738,8 +943,7 @@ def translate_ass_subtitles(ass_file_path, source_language_code, target_language
         print(f"Translated subtitle file saved to: {translated_file_path}")
         return translated_file_path
     except Exception as e:
-        print(f"Error translating subtitles: {str(e)}")
-        traceback.print_exc()
+        logger.exception("Error translating subtitles: %s", e)
         return None
 
 # Only define these functions if we couldn't import them from backend.utils.aws_utils
@@ -748,22 +952,12 @@ if 'fetch_transcript' not in globals():
         """
         Fetch transcript data from URI
         """
-        import urllib.request
-        
         try:
-            # Create a temporary file to store the transcript
-            output_file = os.path.join(tempfile.gettempdir(), f"{uuid.uuid4()}.json")
-            
-            # Download the transcript file
-            urllib.request.urlretrieve(transcript_uri, output_file)
-            print(f"Downloaded transcript to: {output_file}")
-            
-            # Parse the JSON file
-            with open(output_file, 'r') as f:
-                transcript_data = json.load(f)
-            
-            # Clean up the temporary file
-            os.remove(output_file)
+            # Parse the transcript straight from the response stream, without
+            # writing it to a temporary file and reading it back
+            with urllib.request.urlopen(transcript_uri) as response:
+                transcript_data = json.load(response)
+            print("Downloaded transcript")
             
             # Validate the transcript data
             if not transcript_data:
@@ -796,7 +990,6 @@ if 'fetch_transcript' not in globals():
                 return result.get("data")
             else:
                 # Fallback to direct download
-                import urllib.request
                 urllib.request.urlretrieve(transcript_uri, output_file)
                 print(f"Downloaded transcript to: {output_file}")
                 
@@ -809,6 +1002,156 @@ if 'fetch_transcript' not in globals():
             print(f"Error downloading or parsing transcript: {e}")
             return None
 
+# Bytes sampled from each of the start, middle and end of a video for its cache key
+VIDEO_KEY_SAMPLE_SIZE = 1 << 20
+
+def _video_cache_key(video_path):
+    """
+    Build a cache lookup key for a video from its size and samples of its
+    start, middle and end
+    
+    This is cheap enough to compute on every run, but videos that differ
+    only outside the samples share a key, so cache entries also record
+    transcribe_cache.file_digest of the whole file and are checked against it.
+    """
+    size = os.path.getsize(video_path)
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(str(size).encode())
+    with open(video_path, 'rb') as f:
+        for offset in (0, (size - VIDEO_KEY_SAMPLE_SIZE) // 2, size - VIDEO_KEY_SAMPLE_SIZE):
+            f.seek(max(0, offset))
+            hasher.update(f.read(VIDEO_KEY_SAMPLE_SIZE))
+    return hasher.hexdigest()
+
+# Number of videos whose text regions are kept before the least recently used are evicted
+TEXT_REGION_CACHE_MAX_FILES = int(os.getenv("TEXT_REGION_CACHE_MAX_FILES", "256"))
+
+def _load_text_region_cache(cache_path, video_path):
+    """
+    Load cached text regions (timestamp -> regions) for a video, if any
+    
+    Entries made from a different file that shares the lookup key are ignored.
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        if entry.get("content_digest") != transcribe_cache.file_digest(video_path):
+            return {}
+        # Mark the entry as recently used
+        os.utime(cache_path)
+        return entry["regions"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        return {}
+
+def _save_text_region_cache(cache_path, video_path, regions):
+    """Atomically store text regions for a video, evicting old entries if the cache is full"""
+    temp_path = f"{cache_path}.{uuid.uuid4().hex}.tmp"
+    try:
+        entry = {"content_digest": transcribe_cache.file_digest(video_path), "regions": regions}
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: Could not save text detection cache: {e}")
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        return
+    _evict_text_region_cache()
+
+def _evict_text_region_cache():
+    """Remove least recently used text region entries beyond TEXT_REGION_CACHE_MAX_FILES"""
+    entries = []
+    for entry in os.scandir(CACHE_DIR):
+        if entry.name.startswith("text_centers_") and entry.name.endswith(".json"):
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                pass
+    entries.sort(reverse=True)
+    for _, path in entries[TEXT_REGION_CACHE_MAX_FILES:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def _extract_frame_jpeg(video_path, timestamp):
+    """
+    Extract a single video frame as JPEG bytes using ffmpeg
+    
+    Seeking before the input (-ss ahead of -i) jumps to the nearest keyframe
+    instead of decoding from the start, and the frame is piped back in memory.
+    
+    Returns:
+        JPEG bytes, or None if ffmpeg is unavailable or extraction failed
+    """
+    cmd = [
+        FFMPEG, "-hide_banner", "-loglevel", "error",
+        "-ss", f"{timestamp:.3f}", "-i", video_path,
+        "-frames:v", "1", "-f", "image2pipe", "-vcodec", "mjpeg", "pipe:1"
+    ]
+    try:
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=60)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0 or not result.stdout:
+        return None
+    return result.stdout
+
+def _read_frame_jpeg_cv2(cap, timestamp):
+    """
+    Seek an OpenCV capture to a timestamp and return the frame as JPEG bytes
+    
+    Returns:
+        JPEG bytes, or None if the frame could not be read
+    """
+    # Set frame position
+    cap.set(cv2.CAP_PROP_POS_MSEC, timestamp * 1000)
+    
+    # Read frame
+    ret, frame = cap.read()
+    if not ret:
+        return None
+        
+    # Encode frame in memory
+    success, jpeg_buffer = cv2.imencode('.jpg', frame)
+    if not success:
+        return None
+    return jpeg_buffer.tobytes()
+
+# Fraction of the frame height at the top and at the bottom where on-screen text
+# (captions, chyrons) usually sits; only these bands are hashed
+FRAME_HASH_BAND = 0.25
+
+# Frames whose text-band hashes (512 bits) differ in at most this many bits are
+# treated as showing the same on-screen text
+FRAME_HASH_MAX_DISTANCE = 24
+
+def _frame_hash(image_bytes):
+    """
+    Compute a perceptual (DCT) hash of the top and bottom text bands of a JPEG frame
+    
+    Each band is shrunk to 128x32 and the lowest 32x8 DCT coefficients are
+    compared with their median, giving 256 bits per band. Hashing only the
+    bands at this resolution keeps a change of caption over the same
+    background far apart, which a whole-frame 8x8 hash does not.
+    
+    Returns:
+        Hash as an int, or None if the frame could not be decoded
+    """
+    frame = cv2.imdecode(np.frombuffer(image_bytes, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+    if frame is None:
+        return None
+    band_height = max(1, int(frame.shape[0] * FRAME_HASH_BAND))
+    bits = []
+    for band in (frame[:band_height], frame[-band_height:]):
+        thumbnail = cv2.resize(band, (128, 32), interpolation=cv2.INTER_AREA).astype(np.float32)
+        coefficients = cv2.dct(thumbnail)[:8, :32].ravel()
+        # The DC term only reflects overall brightness, so it is left out of the median
+        bits.append(coefficients > np.median(coefficients[1:]))
+    return int.from_bytes(np.packbits(np.concatenate(bits)).tobytes(), 'big')
+
 def detect_text_in_video(video_path, subtitle_segments=None, sample_rate=5):
     """
     Use Amazon Rekognition to detect text in video frames and determine optimal subtitle positions
@@ -833,12 +1176,7 @@ def detect_text_in_video(video_path, subtitle_segments=None, sample_rate=5):
         
     try:
         # Get AWS Rekognition client
-        rekognition = boto3.client(
-            'rekognition',
-            region_name=AWS_REGION,
-            aws_access_key_id=AWS_ACCESS_KEY,
-            aws_secret_access_key=AWS_SECRET_ACCESS_KEY
-        )
+        rekognition = get_aws_client('rekognition')
         
         if not rekognition:
             print("Failed to create Rekognition client. Using default subtitle positioning.")
@@ -886,72 +1224,117 @@ def detect_text_in_video(video_path, subtitle_segments=None, sample_rate=5):
         sample_timestamps = sorted(list(set(sample_timestamps)))
         print(f"Sampling {len(sample_timestamps)} frames for text detection")
         
-        # Store detected text regions for each timestamp
+        # Store the vertical centers (pixels) of detected text regions for each timestamp
         text_regions_by_time = {}
         
+        # Reuse frame analysis from previous runs on the same video
+        cache_path = CACHE_DIR / f"text_centers_{_video_cache_key(video_path)}.json"
+        cached_regions = _load_text_region_cache(cache_path, video_path)
+        cache_updated = False
+        
+        missing_timestamps = []
+        for timestamp in sample_timestamps:
+            cache_key = f"{timestamp:.3f}"
+            if cache_key not in cached_regions:
+                missing_timestamps.append(timestamp)
+            elif cached_regions[cache_key]:
+                text_regions_by_time[timestamp] = cached_regions[cache_key]
+        
+        if len(missing_timestamps) < len(sample_timestamps):
+            print(f"Reusing cached text detection for {len(sample_timestamps) - len(missing_timestamps)} frames")
+        
+        # OpenCV captures are not thread-safe, so the fallback path is serialized
+        cap_lock = threading.Lock()
+        
+        def _read_frame(timestamp):
+            """Extract one frame as JPEG bytes"""
+            image_bytes = _extract_frame_jpeg(video_path, timestamp)
+            # Fall back to OpenCV seek and decode if ffmpeg could not extract the frame
+            if image_bytes is None:
+                with cap_lock:
+                    image_bytes = _read_frame_jpeg_cv2(cap, timestamp)
+            return image_bytes
+        
+        def _detect_frame_text(image_bytes):
+            """Run Rekognition text detection on one frame"""
+            try:
+                return rekognition.detect_text(Image={'Bytes': image_bytes})
+            except Exception as e:
+                return e
+        
+        # Extract the remaining frames concurrently and send only visually
+        # distinct ones to Rekognition; a frame whose text bands hash close to
+        # the last analyzed frame (e.g. the same on-screen caption a few
+        # seconds later) reuses that frame's result
+        last_analyzed_hash = None
+        last_analyzed_index = None
+        pending = {}
+        source_frames = [None] * len(missing_timestamps)
+        for i, image_bytes in enumerate(get_executor().map(_read_frame, missing_timestamps)):
+            if image_bytes is None:
+                continue
+            frame_hash = _frame_hash(image_bytes)
+            if (frame_hash is not None and last_analyzed_hash is not None
+                    and bin(frame_hash ^ last_analyzed_hash).count('1') <= FRAME_HASH_MAX_DISTANCE):
+                source_frames[i] = last_analyzed_index
+                continue
+            source_frames[i] = i
+            pending[i] = get_executor().submit(_detect_frame_text, image_bytes)
+            last_analyzed_hash = frame_hash
+            last_analyzed_index = i
+        
+        reused_count = sum(1 for i, source in enumerate(source_frames) if source is not None and source != i)
+        if reused_count:
+            print(f"Reusing text detection for {reused_count} near-identical frames")
+        
         # Process each sample timestamp
-        for i, timestamp in enumerate(sample_timestamps):
-            # Set frame position
-            cap.set(cv2.CAP_PROP_POS_MSEC, timestamp * 1000)
-            
-            # Read frame
-            ret, frame = cap.read()
-            if not ret:
+        last_progress_time = 0.0
+        for i, timestamp in enumerate(missing_timestamps):
+            if source_frames[i] is None:
                 continue
+            response = pending[source_frames[i]].result()
                 
-            # Show progress
-            show_progress(i + 1, len(sample_timestamps), message="Analyzing video frames")
+            # Show progress at most every PROGRESS_INTERVAL seconds, and on the last frame
+            now = time.monotonic()
+            if now - last_progress_time >= PROGRESS_INTERVAL or i + 1 == len(missing_timestamps):
+                show_progress(i + 1, len(missing_timestamps), message="Analyzing video frames")
+                last_progress_time = now
             
-            # Save frame to temporary file
-            with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as temp_img:
-                temp_path = temp_img.name
-                cv2.imwrite(temp_path, frame)
+            if isinstance(response, Exception):
+                print(f"\nError analyzing frame at {timestamp:.2f}s: {response}")
+                continue
             
-            # Analyze frame with AWS Rekognition
+            # Collect the Rekognition results for this frame
             try:
-                with open(temp_path, 'rb') as image_file:
-                    image_bytes = image_file.read()
-                    
-                    # Detect text in the frame
-                    response = rekognition.detect_text(Image={'Bytes': image_bytes})
-                    detected_text = response.get('TextDetections', [])
-                    
-                    # Extract text regions (bounding boxes)
-                    frame_text_regions = []
-                    for text in detected_text:
-                        if text.get('Type') == 'WORD' and text.get('Confidence', 0) > 70:
-                            box = text.get('Geometry', {}).get('BoundingBox', {})
-                            if box:
-                                # Convert relative coordinates to absolute
-                                x = int(box.get('Left', 0) * width)
-                                y = int(box.get('Top', 0) * height)
-                                w = int(box.get('Width', 0) * width)
-                                h = int(box.get('Height', 0) * height)
-                                
-                                # Store detected text and its region
-                                detected_word = text.get('DetectedText', '')
-                                frame_text_regions.append({
-                                    'text': detected_word,
-                                    'box': (x, y, w, h),
-                                    'confidence': text.get('Confidence', 0)
-                                })
-                    
-                    # Store regions for this timestamp
-                    if frame_text_regions:
-                        text_regions_by_time[timestamp] = frame_text_regions
-                        print(f"\nDetected {len(frame_text_regions)} text regions at {timestamp:.2f}s")
+                detected_text = response.get('TextDetections', [])
+                
+                # Extract text regions (vertical center of each bounding box);
+                # positioning only depends on where text sits vertically
+                frame_text_regions = []
+                for text in detected_text:
+                    if text.get('Type') == 'WORD' and text.get('Confidence', 0) > 70:
+                        box = text.get('Geometry', {}).get('BoundingBox', {})
+                        if box:
+                            # Convert relative coordinates to absolute
+                            y = int(box.get('Top', 0) * height)
+                            h = int(box.get('Height', 0) * height)
+                            frame_text_regions.append(y + (h // 2))
+                
+                # Store regions for this timestamp
+                cached_regions[f"{timestamp:.3f}"] = frame_text_regions
+                cache_updated = True
+                if frame_text_regions:
+                    text_regions_by_time[timestamp] = frame_text_regions
+                    logger.debug("Detected %d text regions at %.2fs", len(frame_text_regions), timestamp)
             except Exception as e:
                 print(f"\nError analyzing frame at {timestamp:.2f}s: {e}")
-            
-            # Remove temporary file
-            try:
-                os.remove(temp_path)
-            except Exception:
-                pass
         
         # Release video capture
         cap.release()
         
+        if cache_updated:
+            _save_text_region_cache(cache_path, video_path, cached_regions)
+        
         # Determine optimal subtitle positions based on detected text regions
         position_map = {}
         
@@ -962,33 +1345,38 @@ def detect_text_in_video(video_path, subtitle_segments=None, sample_rate=5):
         top_region = (0, 0, width, int(height * top_region_height))
         bottom_region = (0, int(height * (1 - bottom_region_height)), width, int(height * bottom_region_height))
         
+        # Vertical thresholds of the top and bottom regions (pixels)
+        top_threshold = height * top_region_height
+        bottom_threshold = height * (1 - bottom_region_height)
+        
         # For each subtitle segment, determine optimal position
         if subtitle_segments:
-            for segment in subtitle_segments:
+            # Flatten detections into parallel arrays sorted by time
+            detection_times = sorted(text_regions_by_time)
+            region_times = np.array(
+                [ts for ts in detection_times for _ in text_regions_by_time[ts]], dtype=np.float64
+            )
+            region_centers = np.array(
+                [center_y for ts in detection_times for center_y in text_regions_by_time[ts]], dtype=np.int64
+            )
+            
+            # Running counts of detections in the top and bottom regions, so the
+            # count within any time range is a difference of two entries
+            top_counts = np.concatenate(([0], np.cumsum(region_centers < top_threshold)))
+            bottom_counts = np.concatenate(([0], np.cumsum(region_centers > bottom_threshold)))
+            
+            # Find the text regions overlapping every segment's time range at once
+            segment_starts = np.array([segment['start_time'] for segment in subtitle_segments], dtype=np.float64)
+            segment_ends = np.array([segment['end_time'] for segment in subtitle_segments], dtype=np.float64)
+            firsts = np.searchsorted(region_times, segment_starts, side='left')
+            lasts = np.maximum(np.searchsorted(region_times, segment_ends, side='right'), firsts)
+            top_text_counts = (top_counts[lasts] - top_counts[firsts]).tolist()
+            bottom_text_counts = (bottom_counts[lasts] - bottom_counts[firsts]).tolist()
+            
+            for segment, top_text_count, bottom_text_count in zip(subtitle_segments, top_text_counts, bottom_text_counts):
                 start_time = segment['start_time']
                 end_time = segment['end_time']
                 
-                # Find text regions that overlap with this segment's time range
-                overlapping_regions = []
-                for ts, regions in text_regions_by_time.items():
-                    if start_time <= ts <= end_time:
-                        overlapping_regions.extend(regions)
-                
-                # Count text in each region
-                top_text_count = 0
-                bottom_text_count = 0
-                
-                for region in overlapping_regions:
-                    x, y, w, h = region['box']
-                    center_y = y + (h // 2)
-                    
-                    # Count text in top region
-                    if center_y < height * top_region_height:
-                        top_text_count += 1
-                    # Count text in bottom region
-                    elif center_y > height * (1 - bottom_region_height):
-                        bottom_text_count += 1
-                
                 # Determine optimal position based on text density
                 if top_text_count > 0 and bottom_text_count == 0:
                     # Text only at top, put subtitles at bottom
@@ -1010,10 +1398,39 @@ def detect_text_in_video(video_path, subtitle_segments=None, sample_rate=5):
         return position_map
     
     except Exception as e:
-        print(f"Error in text detection: {e}")
-        traceback.print_exc()
+        logger.exception("Error in text detection: %s", e)
         return {}
 
+# Default ASS style options, in the order returned by _resolve_font_style
+_DEFAULT_FONT_STYLE = {
+    'font_name': 'Arial',
+    'font_size': 24,
+    'primary_color': '&H00FFFFFF',  # White
+    'outline_color': '&H00000000',  # Black
+    'back_color': '&H80000000',  # Semi-transparent black
+    'bold': 0,
+    'italic': 0,
+    'outline': 2,
+    'shadow': 3,
+}
+
+def _resolve_font_style(font_style):
+    """
+    Get the ASS style options from a font style dict, applying defaults
+    
+    Returns:
+        Tuple of (font_name, font_size, primary_color, outline_color,
+        back_color, bold, italic, outline, shadow)
+    """
+    return tuple(font_style.get(key, default) for key, default in _DEFAULT_FONT_STYLE.items())
+
+# ASS style used for each subtitle position chosen by detect_text_in_video
+_POSITION_TO_ASS_STYLE = {
+    'top_center': "Top",
+    'raised_bottom': "RaisedBottom",
+    'bottom_center': "Default",
+}
+
 def parse_aws_transcript_to_ass(transcript_data, output_ass, font_style=None, grammar=False, video_path=None):
     """
     Parse AWS Transcribe results and create an ASS subtitle file with speaker diarization
@@ -1061,15 +1478,8 @@ def parse_aws_transcript_to_ass(transcript_data, output_ass, font_style=None, gr
             font_style = {}
         
         # Apply defaults for any missing style options
-        font_name = font_style.get('font_name', 'Arial')
-        font_size = font_style.get('font_size', 24)
-        primary_color = font_style.get('primary_color', '&H00FFFFFF')  # White
-        outline_color = font_style.get('outline_color', '&H00000000')  # Black
-        back_color = font_style.get('back_color', '&H80000000')  # Semi-transparent black
-        bold = font_style.get('bold', 0)
-        italic = font_style.get('italic', 0)
-        outline = font_style.get('outline', 2)
-        shadow = font_style.get('shadow', 3)
+        (font_name, font_size, primary_color, outline_color, back_color,
+         bold, italic, outline, shadow) = _resolve_font_style(font_style)
         
         # Create a more intelligent segmentation approach
         print(f"Processing {len(items)} transcript items with {len(speaker_segments)} speaker segments")
@@ -1114,16 +1524,19 @@ def parse_aws_transcript_to_ass(transcript_data, output_ass, font_style=None, gr
                     print("WARNING: No speaker mappings could be created. Speaker diarization will not work correctly.")
                     print("Please check the AWS Transcribe output format or enable debug mode for more details.")
             except Exception as e:
-                print(f"Warning: Error mapping speaker labels: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.warning("Error mapping speaker labels: %s", e, exc_info=True)
         
         # Get video path from options if available
         if video_path is None and isinstance(font_style, dict) and 'video_path' in font_style:
             video_path = font_style.get('video_path')
             
         # First pass: Group words into proper sentences with timing
-        words = []
+        # Words are kept as parallel columns (content, timing, speaker) rather
+        # than one dict per word
+        word_contents = []
+        word_start_times = []
+        word_end_times = []
+        word_speaker_labels = []
         current_sentence = {
             'start_time': None,
             'end_time': None,
@@ -1162,30 +1575,27 @@ def parse_aws_transcript_to_ass(transcript_data, output_ass, font_style=None, gr
                     if speaker is None:
                         speaker = speaker_map.get(item_id, 'spk_0')
                     
-                    # Add word to the list
-                    words.append({
-                        'content': content,
-                        'start_time': start_time,
-                        'end_time': end_time,
-                        'speaker': speaker,
-                        'item_id': item_id
-                    })
+                    # Add word to the columns
+                    word_contents.append(content)
+                    word_start_times.append(start_time)
+                    word_end_times.append(end_time)
+                    word_speaker_labels.append(speaker)
                     
                 elif item.get('type') == 'punctuation':
                     # Add punctuation to the last word
-                    if words:
+                    if word_contents:
                         alternatives = item.get('alternatives', [])
                         if alternatives:
                             punct = alternatives[0].get('content', '')
                             if punct:
-                                words[-1]['content'] += punct
+                                word_contents[-1] += punct
             except Exception as e:
                 print(f"Warning: Error processing item {i}: {e}")
                 continue
         
         # Second pass: Group words into logical segments with proper timing
         segments = []
-        if not words:
+        if not word_contents:
             print("Warning: No words found in transcript")
             return False
             
@@ -1196,35 +1606,34 @@ def parse_aws_transcript_to_ass(transcript_data, output_ass, font_style=None, gr
         
         # Initialize the first segment
         current_segment = {
-            'start_time': words[0]['start_time'],
-            'end_time': words[0]['end_time'],
-            'speaker': words[0]['speaker'],
-            'text': [words[0]['content']],
+            'start_time': word_start_times[0],
+            'end_time': word_end_times[0],
+            'speaker': word_speaker_labels[0],
+            'text': [word_contents[0]],
             'speaker_changed': False
         }
         
-        prev_speaker = words[0]['speaker']
-        prev_end_time = words[0]['end_time']
+        # Speaker changes and natural pauses always start a new segment and
+        # only depend on neighbouring words, so find them in one vectorized pass
+        word_starts = np.array(word_start_times, dtype=np.float64)
+        word_ends = np.array(word_end_times, dtype=np.float64)
+        word_speakers = np.array(word_speaker_labels, dtype=object)
+        speaker_changes = word_speakers[1:] != word_speakers[:-1]
+        forced_breaks = speaker_changes | (word_starts[1:] - word_ends[:-1] > PAUSE_THRESHOLD)
         
         # Process remaining words
-        for i in range(1, len(words)):
-            word = words[i]
-            speaker = word['speaker']
-            content = word['content']
-            start_time = word['start_time']
-            end_time = word['end_time']
+        for i in range(1, len(word_contents)):
+            speaker = word_speaker_labels[i]
+            content = word_contents[i]
+            start_time = word_start_times[i]
+            end_time = word_end_times[i]
             
             # Check if we should start a new segment
-            speaker_changed = speaker != prev_speaker
-            time_gap = start_time - prev_end_time > PAUSE_THRESHOLD
+            speaker_changed = bool(speaker_changes[i - 1])
             segment_too_long = len(current_segment['text']) >= MAX_SEGMENT_LENGTH
             segment_too_long_duration = end_time - current_segment['start_time'] > MAX_SEGMENT_DURATION
             
-            # Removed verbose speaker change logging to reduce output
-            # if speaker_changed:
-            #     print(f"Speaker change detected: {prev_speaker} -> {speaker} at time {format_time_ass(start_time)}")
-            
-            if speaker_changed or time_gap or segment_too_long or segment_too_long_duration:
+            if forced_breaks[i - 1] or segment_too_long or segment_too_long_duration:
                 # Finalize current segment
                 segments.append(current_segment)
                 
@@ -1245,9 +1654,6 @@ def parse_aws_transcript_to_ass(transcript_data, output_ass, font_style=None, gr
                 # Continue current segment
                 current_segment['end_time'] = end_time
                 current_segment['text'].append(content)
-            
-            prev_speaker = speaker
-            prev_end_time = end_time
         
         # Add the last segment
         if current_segment['text']:
@@ -1355,11 +1761,24 @@ def parse_aws_transcript_to_ass(transcript_data, output_ass, font_style=None, gr
             f.write("[Events]\n")
             f.write("Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n")
             
-            # Write subtitle entries
+            # Position ranges ordered by start time (detect_text_in_video already
+            # returns them in segment order), with the running maximum of their
+            # ends, so the first range overlapping a segment is found by bisection
+            position_ranges = sorted(position_map.items(), key=lambda item: item[0][0])
+            range_starts = [range_start for (range_start, _), _ in position_ranges]
+            range_ends = [range_end for (_, range_end), _ in position_ranges]
+            range_positions = [position for _, position in position_ranges]
+            max_range_ends = list(itertools.accumulate(range_ends, max))
+            
+            # Build subtitle entries and write them in one call
+            dialogue_lines = []
             for i, segment in enumerate(segments):
+                segment_start = segment['start_time']
+                segment_end = segment['end_time']
+                
                 # Format timestamps as ASS format (h:mm:ss.cc)
-                start_time = format_time_ass(segment['start_time'])
-                end_time = format_time_ass(segment['end_time'])
+                start_time = format_time_ass(segment_start)
+                end_time = format_time_ass(segment_end)
                 
                 # Get the text content
                 text = ' '.join(segment['text'])
@@ -1378,31 +1797,103 @@ def parse_aws_transcript_to_ass(transcript_data, output_ass, font_style=None, gr
                 
                 # Check if we have position information for this time range
                 if position_map:  # Only check if position_map is not empty
-                    for time_range, position in position_map.items():
-                        range_start, range_end = time_range
+                    # Ranges before k all end before this segment starts, and
+                    # ranges from last on start after it ends
+                    k = bisect.bisect_left(max_range_ends, segment_start)
+                    last = bisect.bisect_right(range_starts, segment_end)
+                    while k < last:
                         # Check if current segment overlaps with this time range
-                        if not (segment['end_time'] < range_start or segment['start_time'] > range_end):
-                            if position == 'top_center':
-                                style = "Top"
-                                break
-                            elif position == 'raised_bottom':
-                                style = "RaisedBottom"
-                                break
-                            elif position == 'bottom_center':
-                                style = "Default"
-                                break
+                        if range_ends[k] >= segment_start and range_positions[k] in _POSITION_TO_ASS_STYLE:
+                            style = _POSITION_TO_ASS_STYLE[range_positions[k]]
+                            break
+                        k += 1
                 
-                # Write ASS entry with the determined style
-                f.write(f"Dialogue: 0,{start_time},{end_time},{style},,0,0,0,,{text}\n")
+                # Add ASS entry with the determined style
+                dialogue_lines.append(f"Dialogue: 0,{start_time},{end_time},{style},,0,0,0,,{text}\n")
+            
+            f.write(''.join(dialogue_lines))
                 
         print(f"ASS subtitle file created with AWS Transcribe results: {output_ass}")
         return True
     
     except Exception as e:
-        print(f"Error parsing AWS transcript to ASS: {e}")
-        traceback.print_exc()
+        logger.exception("Error parsing AWS transcript to ASS: %s", e)
         return False
 
+def _transcribe_with_aws(audio_path, language, settings, audio_uri=None):
+    """
+    Upload extracted audio to S3, run an AWS Transcribe job and fetch its results
+    
+    Args:
+        audio_path: Path to the extracted audio file
+        language: Language code for transcription
+        settings: Transcription job settings
+        audio_uri: S3 URI of audio that was already uploaded (skips the upload)
+        
+    Returns:
+        Transcript data; raises an exception if any step fails
+    """
+    # Step 2: Upload audio to S3 using the imported utility function
+    if audio_uri is None:
+        # Upload to S3 using the utility function from backend.utils.aws_utils
+        # This will use the properly configured AWS credentials
+        upload_result = upload_to_s3(audio_path)
+        
+        if not upload_result.get("success", False) and not isinstance(upload_result, str):
+            print("Failed to upload audio to S3. Falling back to Whisper.")
+            raise Exception("S3 upload failed")
+            
+        # Get the media URI
+        audio_uri = upload_result.get("media_uri") if isinstance(upload_result, dict) else upload_result
+
+    # Step 3: Start AWS Transcribe job
+    job_name = f"transcribe-{uuid.uuid4()}"
+    
+    # Start transcription job using the imported utility function
+    print(f"DEBUG: Starting AWS Transcribe job with language: '{language}'")
+    job_result = start_transcription_job(job_name, audio_uri, settings, language_code=language)
+    
+    # Check if job started successfully
+    # Handle both dictionary format and simple string format for backward compatibility
+    if isinstance(job_result, dict) and not job_result.get("success", False):
+        error_msg = job_result.get('message') or job_result.get('error', 'Unknown error')
+        print(f"Failed to start AWS Transcribe job: {error_msg}")
+        print("Falling back to Whisper.")
+        raise Exception("Transcribe job failed to start")
+    elif job_result is None:
+        print("Failed to start AWS Transcribe job: No result returned")
+        print("Falling back to Whisper.")
+        raise Exception("Transcribe job failed to start")
+    
+    # Step 4: Wait for transcription to complete
+    print("Waiting for AWS Transcribe job to complete...")
+    transcript_uri = wait_for_transcription_job(job_name)
+    if not transcript_uri:
+        print("AWS Transcribe job failed or timed out. Falling back to Whisper.")
+        raise Exception("Transcribe job failed or timed out")
+    
+    # Step 5: Download and parse transcription results
+    print(f"Downloading transcription results from: {transcript_uri}")
+    transcript_result = fetch_transcript(transcript_uri)
+    
+    if not transcript_result.get("success", False):
+        print(f"Failed to download transcription results: {transcript_result.get('message') or transcript_result.get('error', 'Unknown error')}")
+        print("Falling back to Whisper.")
+        raise Exception("Failed to download transcript")
+        
+    transcript_data = transcript_result.get("data")
+    
+    # Validate transcript data
+    if not transcript_data:
+        print("Error: Empty transcript data received from AWS Transcribe")
+        raise Exception("No transcript data available")
+    
+    return transcript_data
+
+def _default_output_path(video_path):
+    """Name the ASS file after the video, in the current directory"""
+    return f"{os.path.splitext(os.path.basename(video_path))[0]}_subtitles.ass"
+
 def generate_ass_from_video(video_path, output_ass, language="en-US", diarize=True, grammar=False, font_style=None, use_aws=True, use_whisper=True, detect_text=True):
     """
     Generate ASS subtitles directly from video with all requested features
@@ -1428,15 +1919,14 @@ def generate_ass_from_video(video_path, output_ass, language="en-US", diarize=Tr
     
     # Prepare output path
     if not output_ass:
-        base_name = os.path.splitext(os.path.basename(video_path))[0]
-        output_ass = f"{base_name}_subtitles.ass"
+        output_ass = _default_output_path(video_path)
     
     # Try AWS Transcribe first if available and requested
     if use_aws:
         print("Attempting to use AWS Transcribe for high-quality transcription...")
         try:
             # Set a timeout for the entire AWS process
-            aws_start_time = time.time()
+            aws_start_time = time.monotonic()
             # AWS_TIMEOUT is now defined globally at the top of the file
             
             # Check if AWS Transcribe is available
@@ -1445,85 +1935,51 @@ def generate_ass_from_video(video_path, output_ass, language="en-US", diarize=Tr
                 raise Exception("AWS services not available")
                 
             # Check if we've exceeded the timeout
-            if time.time() - aws_start_time > AWS_TIMEOUT:
+            if time.monotonic() - aws_start_time > AWS_TIMEOUT:
                 print(f"AWS operations timed out after {AWS_TIMEOUT} seconds. Falling back to Whisper.")
                 raise Exception("AWS timeout")
             
-            # Step 1: Extract audio from video
-            audio_path = extract_audio_from_video(video_path)
-            if not audio_path:
-                print("Failed to extract audio. Falling back to Whisper.")
-                raise Exception("Audio extraction failed")
-        
-            # Step 2: Upload audio to S3 using the imported utility function
-            try:
-                # Generate a unique object name
-                object_name = f"audio/{uuid.uuid4()}.mp3"
-                
-                # Upload to S3 using the utility function from backend.utils.aws_utils
-                # This will use the properly configured AWS credentials
-                upload_result = upload_to_s3(audio_path)
-                
-                if not upload_result.get("success", False) and not isinstance(upload_result, str):
-                    print("Failed to upload audio to S3. Falling back to Whisper.")
-                    raise Exception("S3 upload failed")
-                    
-                # Get the media URI
-                audio_uri = upload_result.get("media_uri") if isinstance(upload_result, dict) else upload_result
+            # Configure transcription settings
+            settings = {}
             
-                # Step 3: Start AWS Transcribe job
-                job_name = f"transcribe-{uuid.uuid4()}"
+            # Add speaker diarization settings if enabled
+            if diarize:
+                settings["ShowSpeakerLabels"] = True
+                settings["MaxSpeakerLabels"] = 10  # Maximum number of speakers to identify
                 
-                # Configure transcription settings
-                settings = {}
-                
-                # Add speaker diarization settings if enabled
-                if diarize:
-                    settings["ShowSpeakerLabels"] = True
-                    settings["MaxSpeakerLabels"] = 10  # Maximum number of speakers to identify
-                    
-                # Add other settings
-                settings["ShowAlternatives"] = True
-                settings["MaxAlternatives"] = 2
-                
-                # Start transcription job using the imported utility function
-                print(f"DEBUG: Starting AWS Transcribe job with language: '{language}'")
-                job_result = start_transcription_job(job_name, audio_uri, settings, language_code=language)
-                
-                # Check if job started successfully
-                # Handle both dictionary format and simple string format for backward compatibility
-                if isinstance(job_result, dict) and not job_result.get("success", False):
-                    error_msg = job_result.get('error', 'Unknown error')
-                    print(f"Failed to start AWS Transcribe job: {error_msg}")
-                    print("Falling back to Whisper.")
-                    raise Exception("Transcribe job failed to start")
-                elif job_result is None:
-                    print("Failed to start AWS Transcribe job: No result returned")
-                    print("Falling back to Whisper.")
-                    raise Exception("Transcribe job failed to start")
-                
-                # Step 4: Wait for transcription to complete
-                print("Waiting for AWS Transcribe job to complete...")
-                transcript_uri = wait_for_transcription_job(job_name)
-                if not transcript_uri:
-                    print("AWS Transcribe job failed or timed out. Falling back to Whisper.")
-                    raise Exception("Transcribe job failed or timed out")
-                
-                # Step 5: Download and parse transcription results
-                print(f"Downloading transcription results from: {transcript_uri}")
-                transcript_result = fetch_transcript(transcript_uri)
-                
-                if not transcript_result.get("success", False):
-                    print(f"Failed to download transcription results: {transcript_result.get('error', 'Unknown error')}")
-                    print("Falling back to Whisper.")
-                    raise Exception("Failed to download transcript")
+            # Add other settings
+            settings["ShowAlternatives"] = True
+            settings["MaxAlternatives"] = 2
+            
+            # Reuse the transcript from an earlier run on the same video with the same settings
+            cache_key = transcribe_cache.make_key(_video_cache_key(video_path), language, settings)
+            transcript_data = transcribe_cache.get(cache_key, video_path)
+            audio_path = None
+            audio_uri = None
+            
+            if transcript_data is not None:
+                print("Using cached AWS Transcribe results for this video")
+            else:
+                # Set up the Transcribe client while the audio is extracted and
+                # uploaded, so the job can be started as soon as the upload ends
+                get_executor().submit(get_aws_client, 'transcribe')
+                # Digest the whole video for the cache entry in the background too
+                content_digest = get_executor().submit(transcribe_cache.file_digest, video_path)
                     
-                transcript_data = transcript_result.get("data")
-                
-                # Validate transcript data
-                if not transcript_data:
-                    print("Error: Empty transcript data received from AWS Transcribe")
-                    raise Exception("No transcript data available")
+                # Steps 1-2: Extract audio from video and upload it to S3,
+                # streaming it when possible
+                audio_uri = stream_audio_to_s3(video_path)
+                if not audio_uri:
+                    audio_path = extract_audio_from_video(video_path)
+                    if not audio_path:
+                        print("Failed to extract audio. Falling back to Whisper.")
+                        raise Exception("Audio extraction failed")
+        
+            try:
+                # Steps 2-5: Transcribe the audio with AWS (skipped on a cache hit)
+                if transcript_data is None:
+                    transcript_data = _transcribe_with_aws(audio_path, language, settings, audio_uri)
+                    transcribe_cache.put(cache_key, transcript_data, content_digest.result())
                     
                 # Debug transcript data structure
                 print(f"Transcript data keys: {list(transcript_data.keys()) if isinstance(transcript_data, dict) else 'Not a dictionary'}")
@@ -1542,7 +1998,7 @@ def generate_ass_from_video(video_path, output_ass, language="en-US", diarize=Tr
                 success = parse_aws_transcript_to_ass(transcript_data, output_ass, font_style, grammar, video_path)
                 
                 # Clean up temporary files
-                if os.path.exists(audio_path):
+                if audio_path and os.path.exists(audio_path):
                     os.remove(audio_path)
                 
                 if success:
@@ -1572,8 +2028,7 @@ def generate_ass_from_video_whisper(video_path, output_ass, language="en-US", di
     
     # Prepare output path
     if not output_ass:
-        base_name = os.path.splitext(os.path.basename(video_path))[0]
-        output_ass = f"{base_name}_subtitles.ass"
+        output_ass = _default_output_path(video_path)
     
     try:
         # Step 1: Transcribe video directly using Whisper with a smaller model for speed
@@ -1583,7 +2038,7 @@ def generate_ass_from_video_whisper(video_path, output_ass, language="en-US", di
         model = whisper.load_model("tiny")
         
         # Set a timeout for Whisper processing
-        start_time = time.time()
+        start_time = time.monotonic()
         max_whisper_time = 60  # 60 seconds max for Whisper processing
         
         print("Loading Whisper model... this may take a moment")
@@ -1606,8 +2061,7 @@ def generate_ass_from_video_whisper(video_path, output_ass, language="en-US", di
             )
             print("Whisper transcription completed successfully")
         except Exception as e:
-            print(f"Error during Whisper transcription: {e}")
-            traceback.print_exc()
+            logger.exception("Error during Whisper transcription: %s", e)
             return False
         
         # Step 2: Generate ASS file directly from transcription result
@@ -1618,15 +2072,8 @@ def generate_ass_from_video_whisper(video_path, output_ass, language="en-US", di
             font_style = {}
         
         # Apply defaults for any missing style options
-        font_name = font_style.get('font_name', 'Arial')
-        font_size = font_style.get('font_size', 24)
-        primary_color = font_style.get('primary_color', '&H00FFFFFF')  # White
-        outline_color = font_style.get('outline_color', '&H00000000')  # Black
-        back_color = font_style.get('back_color', '&H80000000')  # Semi-transparent black
-        bold = font_style.get('bold', 0)
-        italic = font_style.get('italic', 0)
-        outline = font_style.get('outline', 2)
-        shadow = font_style.get('shadow', 3)
+        (font_name, font_size, primary_color, outline_color, back_color,
+         bold, italic, outline, shadow) = _resolve_font_style(font_style)
         
         # Extract segments and preprocess them
         segments = result['segments']
@@ -1638,24 +2085,24 @@ def generate_ass_from_video_whisper(video_path, output_ass, language="en-US", di
         # Detect speaker changes based on content analysis
         # No special case handling for any specific video
         # Generic speaker change detection for all videos
-        print("Using automatic speaker change detection")
-        for i in range(1, len(segments)):  # Start from second segment
-            prev_text = segments[i-1]['text'].strip()
-            curr_text = segments[i]['text'].strip()
-            
-            # Check for dialogue patterns that indicate speaker changes
-            sentence_end = any(prev_text.endswith(c) for c in ['.', '?', '!'])
-            starts_with_dash = curr_text.startswith('-')
-            starts_with_quote = curr_text.startswith('"') and not prev_text.endswith('"')
-            starts_with_name = re.match(r'^[A-Z][a-z]+:', curr_text) is not None
-            new_sentence = sentence_end and len(curr_text) > 0 and curr_text[0].isupper()
-            
-            # Determine if this is likely a new speaker
-            speaker_changes[i] = any([starts_with_dash, starts_with_quote, starts_with_name, new_sentence])
-            
-            # Additional heuristic: alternating speakers in question-answer patterns
-            if prev_text.endswith('?') and not curr_text.endswith('?'):
-                speaker_changes[i] = True
+        if diarize:
+            print("Using automatic speaker change detection")
+            # Strip each segment once; every text is compared with both neighbours
+            texts = [segment['text'].strip() for segment in segments]
+            for i in range(1, len(texts)):  # Start from second segment
+                prev_text = texts[i-1]
+                curr_text = texts[i]
+                
+                # Dialogue patterns that indicate speaker changes, cheapest first so
+                # the first match decides: a leading dash or quote, a "Name:" prefix,
+                # a capitalized new sentence, or an answer following a question
+                speaker_changes[i] = (
+                    curr_text.startswith('-')
+                    or (curr_text.startswith('"') and not prev_text.endswith('"'))
+                    or (prev_text.endswith(('.', '?', '!')) and curr_text[:1].isupper())
+                    or (prev_text.endswith('?') and not curr_text.endswith('?'))
+                    or _RE_SPEAKER_NAME.match(curr_text) is not None
+                )
         
         # Apply grammar corrections if requested
         if grammar:
@@ -1700,33 +2147,37 @@ def generate_ass_from_video_whisper(video_path, output_ass, language="en-US", di
             f.write("[Events]\n")
             f.write("Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n")
             
-            # Write subtitle entries directly from the segments
-            for i, segment in enumerate(segments):
-                # Format timestamps as ASS format (h:mm:ss.cc)
-                start_time = format_time_ass(segment['start'])
-                end_time = format_time_ass(segment['end'])
-                
-                # Get the text content
-                text = segment['text'].strip()
-                
-                # Apply speaker diarization if requested
-                if diarize and i < len(speaker_changes) and speaker_changes[i]:
+            # Write subtitle entries directly from the segments, always using
+            # the Default style. The diarization check is made once here rather
+            # than per segment, so the plain path carries no speaker branches.
+            dialogue_lines = []
+            if not diarize:
+                for segment in segments:
+                    dialogue_lines.append(f"Dialogue: 0,{format_time_ass(segment['start'])},{format_time_ass(segment['end'])},Default,,0,0,0,,{segment['text'].strip()}\n")
+            else:
+                for i, segment in enumerate(segments):
+                    # Format timestamps as ASS format (h:mm:ss.cc)
+                    start_time = format_time_ass(segment['start'])
+                    end_time = format_time_ass(segment['end'])
+                    
+                    # Get the text content
+                    text = segment['text'].strip()
+                    
                     # Add two hyphens at the beginning for speaker change
-                    text = f"-- {text.lstrip('-').strip()}"
-                    print(f"Added speaker change marker to segment {i+1}: {text}")
-                
-                # Always use Default style for all subtitles
-                style = "Default"
-                
-                # Write ASS entry
-                f.write(f"Dialogue: 0,{start_time},{end_time},{style},,0,0,0,,{text}\n")
+                    if speaker_changes[i]:
+                        text = f"-- {text.lstrip('-').strip()}"
+                        logger.debug("Added speaker change marker to segment %d: %s", i + 1, text)
+                    
+                    # Add ASS entry
+                    dialogue_lines.append(f"Dialogue: 0,{start_time},{end_time},Default,,0,0,0,,{text}\n")
+            
+            f.write(''.join(dialogue_lines))
         
         print(f"ASS subtitle file created: {output_ass}")
         return True
         
     except Exception as e:
-        print(f"Error generating ASS subtitles: {e}")
-        traceback.print_exc()
+        logger.exception("Error generating ASS subtitles: %s", e)
         return False
 
 def show_progress(current, total, width=50, message="Progress"):
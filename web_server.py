@@ -10,8 +10,12 @@ import json
 import uuid
 import io
 import mimetypes
+import shutil
+import threading
 import urllib.parse
 import logging
+import argparse
+import webbrowser
 import email.parser
 from pathlib import Path
 from http.server import HTTPServer, BaseHTTPRequestHandler
@@ -47,6 +51,13 @@ OUTPUT_FOLDER = os.path.join(PROJECT_ROOT, 'outputs')
 FRONTEND_FOLDER = os.path.join(PROJECT_ROOT, 'frontend')
 ALLOWED_EXTENSIONS = {'mp4', 'avi', 'mov', 'mkv', 'webm'}
 
+# Chunk size for streaming files to clients
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Set once the HTTP server is bound and listening, so the browser is opened only then
+SERVER_READY = threading.Event()
+SERVER_READY_TIMEOUT = 30
+
 # Create upload and output folders if they don't exist
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 os.makedirs(OUTPUT_FOLDER, exist_ok=True)
@@ -335,23 +346,20 @@ class VideoSubtitleServer(BaseHTTPRequestHandler):
             return
         
         try:
-            # Simple approach: read the entire file
             with open(file_path, 'rb') as f:
-                file_content = f.read()
-            
-            # Determine content type based on file extension
-            content_type = 'application/octet-stream'
-            
-            # Send headers
-            self.send_response(HTTPStatus.OK)
-            self.send_header('Content-Type', content_type)
-            self.send_header('Content-Disposition', f'attachment; filename="{clean_filename}"')
-            self.send_header('Content-Length', str(len(file_content)))
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
-            # Send the file content
-            self.wfile.write(file_content)
+                # Determine content type based on file extension
+                content_type = 'application/octet-stream'
+                
+                # Send headers
+                self.send_response(HTTPStatus.OK)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Disposition', f'attachment; filename="{clean_filename}"')
+                self.send_header('Content-Length', str(os.fstat(f.fileno()).st_size))
+                self.send_header('Access-Control-Allow-Origin', '*')
+                self.end_headers()
+                
+                # Stream the file content instead of reading it all into memory
+                shutil.copyfileobj(f, self.wfile, COPY_BUFFER_SIZE)
             
             logger.info(f"File {clean_filename} downloaded successfully")
         except Exception as e:
@@ -382,10 +390,8 @@ class VideoSubtitleServer(BaseHTTPRequestHandler):
                 content_type = 'application/octet-stream'
                 
             with open(file_path, 'rb') as f:
-                content = f.read()
-                
-            self._set_headers(content_type=content_type)
-            self.wfile.write(content)
+                self._set_headers(content_type=content_type)
+                shutil.copyfileobj(f, self.wfile, COPY_BUFFER_SIZE)
             return True
         except Exception as e:
             logger.exception(f"Error serving static file: {str(e)}")
@@ -402,10 +408,9 @@ class VideoSubtitleServer(BaseHTTPRequestHandler):
         path = parsed_path.path
         
         # Route to appropriate handler
-        if path == '/api/health':
-            self._handle_health_check()
-        elif path == '/api/languages':
-            self._handle_get_languages()
+        handler = self._GET_ROUTES.get(path)
+        if handler:
+            handler(self)
         elif path.startswith('/api/download/'):
             # Extract filename from path - remove the prefix
             filename = path.replace('/api/download/', '')
@@ -434,34 +439,43 @@ class VideoSubtitleServer(BaseHTTPRequestHandler):
         path = parsed_path.path
         
         # Route to appropriate handler
-        if path == '/api/upload':
-            self._handle_upload_file()
-        elif path == '/api/generate-subtitle':
-            self._handle_generate_subtitle()
+        handler = self._POST_ROUTES.get(path)
+        if handler:
+            handler(self)
         else:
             self._send_error_response('Not found', HTTPStatus.NOT_FOUND)
+    
+    # Exact-path API routes
+    _GET_ROUTES = {
+        '/api/health': _handle_health_check,
+        '/api/languages': _handle_get_languages,
+    }
+    _POST_ROUTES = {
+        '/api/upload': _handle_upload_file,
+        '/api/generate-subtitle': _handle_generate_subtitle,
+    }
 
 def open_browser(host='localhost', port=5000):
-    """Open the browser after a short delay"""
-    import webbrowser
-    import threading
-    import time
-    
+    """Open the browser once the server is listening"""
     def _open_browser():
-        time.sleep(2)  # Give the server a moment to start
+        # Wait until the server is listening rather than a fixed delay
+        if not SERVER_READY.wait(timeout=SERVER_READY_TIMEOUT):
+            logger.error("Server did not start; not opening the browser")
+            return
         url = f"http://{host}:{port}"
         webbrowser.open(url)
         logger.info(f"Browser opened to {url}")
         print(f"Browser opened to {url}")
     
-    browser_thread = threading.Thread(target=_open_browser)
-    browser_thread.daemon = True
-    browser_thread.start()
+    # A daemon thread, so a server that fails to start does not keep the
+    # process alive while this waits on SERVER_READY
+    threading.Thread(target=_open_browser, daemon=True).start()
 
 def run_server(host='0.0.0.0', port=5000, open_browser_automatically=True):
     """Run the HTTP server"""
     server_address = (host, port)
     httpd = HTTPServer(server_address, VideoSubtitleServer)
+    SERVER_READY.set()
     
     # Log server startup
     logger.info(f"Starting server on http://{host}:{port}")
@@ -484,7 +498,6 @@ def run_server(host='0.0.0.0', port=5000, open_browser_automatically=True):
 
 if __name__ == '__main__':
     # Parse command line arguments
-    import argparse
     parser = argparse.ArgumentParser(description='Run the VideoSubtitleCleanser web server')
     parser.add_argument('--host', default='0.0.0.0', help='Host to bind to')
     parser.add_argument('--port', type=int, default=5000, help='Port to bind to')